@@ -1,4 +1,5 @@
-import csv
+# Run from this folder: python CSV.py
+from csv_io.csv_io import write_rows
 
 # declare rows
 rows = [
@@ -9,6 +10,4 @@ rows = [
 
 filename = "university_records.csv"
 
-with open(filename, "w") as csvfile:
-    csvwriter = csv.writer(csvfile)
-    csvwriter.writerows(rows)
+write_rows(filename, rows)
@@ -100,25 +100,51 @@ def login_system():
 
 # =========================================encryption_lab()===============================================================
 import hashlib
+from functools import lru_cache
 
 DEBUG = True
+CHUNK_SIZE = 1 << 16  # characters per read when streaming files
 
 
-def log(msg):
+def log(msg, *args):
+    # args are only formatted into msg when DEBUG is on
     if DEBUG:
-        print("[DEBUG]", msg)
+        print("[DEBUG]", msg % args if args else msg)
 
 
 # 🔐 1️⃣ Caesar Cipher
-def caesar_encrypt(text, shift):
-    result = ""
-    for ch in text:
-        if ch.isalpha():
-            new_char = chr((ord(ch) + shift - 97) % 26 + 97)
-            log(f"{ch} -> {new_char}")
-            result += new_char
+class _CaesarTable(dict):
+    # str.translate table: ASCII letters are filled in up front, any other
+    # character is worked out the first time it is seen and then remembered
+
+    def __init__(self, shift):
+        super().__init__()
+        self.shift = shift
+        for ch in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ":
+            self[ord(ch)] = self.__missing__(ord(ch))
+
+    def __missing__(self, code):
+        if chr(code).isalpha():
+            new_code = (code + self.shift - 97) % 26 + 97
         else:
-            result += ch
+            new_code = code
+        self[code] = new_code
+        return new_code
+
+
+@lru_cache(maxsize=26)
+def _caesar_table(shift):
+    return _CaesarTable(shift)
+
+
+def caesar_encrypt(text, shift):
+    result = text.translate(_caesar_table(shift % 26))
+
+    if DEBUG:
+        for ch, new_char in zip(text, result):
+            if ch != new_char:
+                log("%s -> %s", ch, new_char)
+
     return result
 
 
@@ -126,24 +152,93 @@ def caesar_decrypt(text, shift):
     return caesar_encrypt(text, -shift)
 
 
+def caesar_encrypt_iter(chunks, shift):
+    # 🔁 generator: every character is independent, so chunks need no stitching
+    table = _caesar_table(shift % 26)
+    for chunk in chunks:
+        yield chunk.translate(table)
+
+
+def caesar_encrypt_stream(file_in, file_out, shift, chunk_size=CHUNK_SIZE):
+    chunks = iter(lambda: file_in.read(chunk_size), "")
+    for chunk in caesar_encrypt_iter(chunks, shift):
+        file_out.write(chunk)
+
+
 # 🔐 2️⃣ XOR Encryption
+def xor_bytes(data, key, offset=0):
+    # bytes in, bytes out; offset = position of data[0] in the whole message
+    import numpy as np
+
+    if isinstance(key, str):
+        key = key.encode()
+    buf = np.frombuffer(data, dtype=np.uint8)
+    if not len(buf):
+        return b""
+
+    # tile the key once to the buffer length and XOR everything in one go
+    start = offset % len(key)
+    key = key[start:] + key[:start]
+    stream = np.frombuffer(key * -(-len(buf) // len(key)), dtype=np.uint8)[: len(buf)]
+    return (buf ^ stream).tobytes()
+
+
+def xor_iter(chunks, key):
+    # 🔁 keeps the keystream position running across chunks
+    offset = 0
+    for chunk in chunks:
+        yield xor_bytes(chunk, key, offset)
+        offset += len(chunk)
+
+
+def xor_stream(file_in, file_out, key, chunk_size=CHUNK_SIZE):
+    # binary files; the same call encrypts and decrypts
+    chunks = iter(lambda: file_in.read(chunk_size), b"")
+    for chunk in xor_iter(chunks, key):
+        file_out.write(chunk)
+
+
 def xor_encrypt(text, key):
-    encrypted = ""
-    for i in range(len(text)):
-        encrypted += chr(ord(text[i]) ^ ord(key[i % len(key)]))
-        log(f"{text[i]} -> {encrypted[-1]}")
-    return base64.b64encode(encrypted.encode()).decode()
+    data = text.encode()
+    encrypted = xor_bytes(data, key)
+
+    if DEBUG:
+        for a, b in zip(data, encrypted):
+            log("%r -> %r", chr(a), chr(b))
+
+    return base64.b64encode(encrypted).decode()
 
 
 def xor_decrypt(encoded_text, key):
-    decoded = base64.b64decode(encoded_text).decode()
-    decrypted = ""
+    decoded = base64.b64decode(encoded_text)
+    decrypted = xor_bytes(decoded, key)
+
+    if DEBUG:
+        for a, b in zip(decoded, decrypted):
+            log("%r -> %r", chr(a), chr(b))
+
+    return decrypted.decode()
+
 
-    for i in range(len(decoded)):
-        decrypted += chr(ord(decoded[i]) ^ ord(key[i % len(key)]))
-        log(f"{decoded[i]} -> {decrypted[-1]}")
+def bench_xor(sizes=(1 << 10, 1 << 20, 1 << 26)):
+    import os
+    import time
+
+    key = b"Naman@123"
+    print(f"{'Size(Bytes)':<15}{'Seconds':<14}{'MB/s':<10}")
+    print("-" * 40)
 
-    return decrypted
+    for size in sizes:
+        data = os.urandom(size)
+        repeat = 100 if size <= 1 << 20 else 3
+        best = float("inf")
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            xor_bytes(data, key)
+            best = min(best, time.perf_counter() - start)
+
+        print(f"{size:<15}{best:<14.6f}{size / best / (1 << 20):<10.1f}")
 
 
 # 🔐 3️⃣ SHA-256
@@ -177,6 +272,20 @@ def test_caesar():
     else:
         print("FAIL ❌")
 
+    # stream a bigger text through in small chunks
+    import io
+
+    big = "Hello, World! " * 1000
+    out = io.StringIO()
+    caesar_encrypt_stream(io.StringIO(big), out, shift, chunk_size=7)
+
+    # expected value via the quiet generator: caesar_encrypt would log every
+    # changed character of the 14,000 while DEBUG is on
+    if out.getvalue() == "".join(caesar_encrypt_iter([big], shift)):
+        print("Stream PASS ✅")
+    else:
+        print("Stream FAIL ❌")
+
 
 def test_xor():
     print("\n[TEST] XOR Encryption")
@@ -195,6 +304,19 @@ def test_xor():
     else:
         print("FAIL ❌")
 
+    # non-ASCII text and a chunked stream with an odd chunk size
+    import io
+
+    text = "héllo wörld 🔐 " * 100
+    out = io.BytesIO()
+    xor_stream(io.BytesIO(text.encode()), out, key, chunk_size=5)
+
+    # undo it with xor_bytes: xor_decrypt would log every byte while DEBUG is on
+    if xor_bytes(out.getvalue(), key).decode() == text:
+        print("Stream PASS ✅")
+    else:
+        print("Stream FAIL ❌")
+
 
 def test_hash():
     print("\n[TEST] SHA-256")
@@ -222,6 +344,7 @@ def run_all_tests():
 # 🎯 MENU
 # =========================
 def encryption_lab():
+    global DEBUG
 
     while True:
         print("\n==== Encryption Lab ====")
@@ -230,6 +353,7 @@ def encryption_lab():
         print("3. SHA-256 (Manual)")
         print("4. Run All Tests")
         print("5. Toggle Debug Logs")
+        print("6. XOR Throughput Benchmark")
         print("0. Exit")
 
         choice = input("Choose option: ")
@@ -274,6 +398,9 @@ def encryption_lab():
             DEBUG = not DEBUG
             print("DEBUG =", DEBUG)
 
+        elif choice == "6":
+            bench_xor()
+
         elif choice == "0":
             break
 
@@ -486,6 +613,7 @@ def merge_intervals():
 
     # Static intervals (uncomment to test specific cases)
     # intervals = [[8, 16], [5, 19]]
+    # intervals = [[5, 19], [8, 16]]  # contained interval, used to shrink to [5, 16]
 
     # Dynamic random intervals
     # Generate random number of intervals (2 to 5)
@@ -513,7 +641,7 @@ def merge_intervals():
         last = result[-1]
 
         if start <= last[1]:
-            last[1] = end
+            last[1] = max(last[1], end)  # a contained interval must not shrink it
         else:
             result.append([start, end])
 
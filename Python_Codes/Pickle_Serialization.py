@@ -1,7 +1,7 @@
-import pickle
+# Run from this folder: python Pickle_Serialization.py
+from serialization.serialization import dump
 
 data = {"name": "Alice", "age": 25, "languages": ["English", "Spanish"]}
 
-# Serialize to a binary format
-with open("data.pk1", "wb") as file:
-    pickle.dump(data, file)  # Writing binary serialized data
+# Serialize to a binary format (pickle protocol 5, see serialization/)
+dump(data, "data.pk1", codec="pickle")
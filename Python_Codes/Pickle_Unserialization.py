@@ -1,8 +1,11 @@
-import pickle
+# Run from this folder: python Pickle_Unserialization.py
+from serialization.serialization import load
 
 # Deserialize from a binary format
-with open("data.pk1", "rb") as file:
-    loaded_data = pickle.load(file)
+# data.pk1 must come from Pickle_Serialization.py (a record file); a file
+# written with plain pickle.dump() is rejected with "not a record file".
+# NumPy arrays in it load as read-only views into the file
+loaded_data = load("data.pk1")
 
 print(
     loaded_data
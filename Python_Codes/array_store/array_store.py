@@ -0,0 +1,101 @@
+import json
+
+import numpy as np
+from numpy.lib.format import descr_to_dtype, dtype_to_descr
+
+# file layout: MAGIC | header (JSON padded with spaces to HEADER_SIZE) | C-order data
+# the header has a fixed size so append() can rewrite it without moving the data,
+# and HEADER_SIZE is a multiple of 64 so the data starts on a cache line
+MAGIC = b"NPSTORE1"
+HEADER_SIZE = 256
+
+
+def _c_strides(dtype, shape):
+    strides, step = [], dtype.itemsize
+    for n in reversed(shape):
+        strides.insert(0, step)
+        step *= n
+    return strides
+
+
+def _check_dtype(dtype):
+    # object fields are pointers into this process, meaningless on disk
+    if dtype.hasobject:
+        raise ValueError(f"cannot store dtype {dtype} holding Python objects")
+
+
+def _header(dtype, shape):
+    dtype = np.dtype(dtype)
+    # dtype_to_descr keeps the fields of structured (record) dtypes, dtype.str does not
+    info = {"dtype": dtype_to_descr(dtype), "shape": list(shape), "strides": _c_strides(dtype, shape)}
+
+    raw = MAGIC + json.dumps(info).encode()
+    if len(raw) > HEADER_SIZE:
+        raise ValueError("array header does not fit, too many dimensions or fields")
+    return raw.ljust(HEADER_SIZE, b" ")
+
+
+def read_header(path):
+    with open(path, "rb") as f:
+        raw = f.read(HEADER_SIZE)
+    if not raw.startswith(MAGIC):
+        raise ValueError(f"{path} is not an array store file")
+
+    info = json.loads(raw[len(MAGIC) :])
+    info["dtype"] = descr_to_dtype(info["dtype"])
+    info["shape"] = tuple(info["shape"])
+    info["strides"] = tuple(info["strides"])
+    return info
+
+
+def save(path, arr):
+    # rows are the first axis, so a 0-d array has nothing to append to
+    arr = np.asarray(arr)
+    if arr.ndim == 0:
+        raise ValueError("cannot store a 0-d array, use arr.reshape(1)")
+    _check_dtype(arr.dtype)
+    arr = np.ascontiguousarray(arr)
+    with open(path, "wb") as f:
+        f.write(_header(arr.dtype, arr.shape))
+        f.write(arr)
+
+
+def load(path, mode="r"):
+    # zero-copy: pages are only read from disk when they are touched
+    info = read_header(path)
+    if 0 in info["shape"]:
+        return np.empty(info["shape"], dtype=info["dtype"])
+    return np.memmap(path, dtype=info["dtype"], mode=mode, offset=HEADER_SIZE, shape=info["shape"])
+
+
+def read_rows(path, start, stop):
+    # copy of rows [start, stop) without mapping or reading anything else
+    info = read_header(path)
+    rows = info["shape"][0] if info["shape"] else 0
+    start, stop, _ = slice(start, stop).indices(rows)
+    stop = max(start, stop)
+    row_bytes = info["strides"][0]
+
+    with open(path, "rb") as f:
+        f.seek(HEADER_SIZE + start * row_bytes)
+        data = f.read((stop - start) * row_bytes)
+    return np.frombuffer(data, dtype=info["dtype"]).reshape((stop - start,) + info["shape"][1:])
+
+
+def append(path, rows):
+    # add rows after the last row the header knows about, then rewrite the
+    # header; rows orphaned by a crash between the two writes are cut off
+    info = read_header(path)
+    _check_dtype(info["dtype"])
+    rows = np.ascontiguousarray(rows, dtype=info["dtype"])
+    if rows.shape[1:] != info["shape"][1:]:
+        raise ValueError(f"rows of shape {rows.shape[1:]} do not match {info['shape'][1:]}")
+
+    shape = (info["shape"][0] + len(rows),) + info["shape"][1:]
+    with open(path, "r+b") as f:
+        f.seek(HEADER_SIZE + info["shape"][0] * info["strides"][0])
+        f.truncate()
+        f.write(rows)
+        f.seek(0)
+        f.write(_header(info["dtype"], shape))
+    return shape
@@ -0,0 +1,61 @@
+# Run the benchmark as python -m Python_Codes.array_store.bench_array_store
+
+import os
+import pickle
+import tempfile
+import time
+
+import numpy as np
+
+from Python_Codes.array_store.array_store import save, load, read_rows
+
+SHAPE = (2_000_000, 16)  # 256 MB of float64
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def run():
+    arr = np.random.default_rng(0).random(SHAPE)
+    mb = arr.nbytes / (1 << 20)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = os.path.join(tmp, "a.npst")
+        npy = os.path.join(tmp, "a.npy")
+        pkl = os.path.join(tmp, "a.pkl")
+
+        def pickle_dump():
+            with open(pkl, "wb") as f:
+                pickle.dump(arr, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        def pickle_load():
+            with open(pkl, "rb") as f:
+                return pickle.load(f)
+
+        rows = slice(1_000_000, 1_001_000)
+        cases = [
+            ("array_store", lambda: save(store, arr), lambda: load(store),
+             lambda: np.array(load(store)[rows]), lambda: read_rows(store, rows.start, rows.stop)),
+            ("np.save/load", lambda: np.save(npy, arr), lambda: np.load(npy),
+             lambda: np.load(npy, mmap_mode="r")[rows].copy(), lambda: np.load(npy)[rows].copy()),
+            ("pickle", pickle_dump, pickle_load, None, lambda: pickle_load()[rows].copy()),
+        ]
+
+        print(f"{mb:.0f} MB array, slice of {rows.stop - rows.start} rows")
+        print(f"{'Format':<14}{'Write MB/s':<12}{'Open (s)':<12}{'Full read (s)':<15}{'Slice mmap (s)':<16}{'Slice read (s)':<15}")
+        print("-" * 84)
+
+        for name, write, open_, slice_mmap, slice_read in cases:
+            _, t_write = timed(write)
+            opened, t_open = timed(open_)
+            _, t_full = timed(lambda: float(np.asarray(opened).sum()))
+            t_mmap = timed(slice_mmap)[1] if slice_mmap else float("nan")
+            _, t_slice = timed(slice_read)
+            print(f"{name:<14}{mb / t_write:<12.0f}{t_open:<12.4f}{t_full:<15.4f}{t_mmap:<16.5f}{t_slice:<15.5f}")
+
+
+if __name__ == "__main__":
+    run()
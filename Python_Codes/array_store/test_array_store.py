@@ -0,0 +1,93 @@
+# Run the program as pytest -sv .\test_array_store.py
+
+import numpy as np
+import pytest
+
+from Python_Codes.array_store.array_store import (
+    HEADER_SIZE,
+    save,
+    load,
+    read_rows,
+    read_header,
+    append,
+)
+
+
+def test_round_trip_is_zero_copy(tmp_path):
+    path = tmp_path / "grid.npst"
+    grid = np.arange(24, dtype=np.int64).reshape(2, 3, 4)
+    save(path, grid)
+
+    header = read_header(path)
+    assert header["shape"] == (2, 3, 4)
+    assert header["strides"] == grid.strides
+
+    mm = load(path)
+    assert isinstance(mm, np.memmap)
+    assert (mm == grid).all()
+    assert path.stat().st_size == HEADER_SIZE + grid.nbytes
+
+
+def test_fortran_and_views_are_stored_c_order(tmp_path):
+    path = tmp_path / "t.npst"
+    arr = np.asfortranarray(np.arange(12.0).reshape(3, 4)).T[::2]
+    save(path, arr)
+    assert (load(path) == arr).all()
+
+
+def test_append_and_read_rows(tmp_path):
+    path = tmp_path / "rows.npst"
+    save(path, np.zeros((0, 3), dtype=np.float32))
+    for i in range(5):
+        append(path, np.full((2, 3), i, dtype=np.float32))
+
+    assert read_header(path)["shape"] == (10, 3)
+    assert (read_rows(path, 4, 6) == 2).all()
+    assert read_rows(path, 8, 100).shape == (2, 3)
+    assert (load(path)[-1] == 4).all()
+
+    with pytest.raises(ValueError):
+        append(path, np.zeros((1, 4)))
+
+
+def test_write_through_memmap(tmp_path):
+    path = tmp_path / "w.npst"
+    save(path, np.zeros(10, dtype=np.int16))
+    mm = load(path, mode="r+")
+    mm[3] = 7
+    mm.flush()
+    assert read_rows(path, 3, 4).tolist() == [7]
+
+
+def test_structured_records(tmp_path):
+    path = tmp_path / "records.npst"
+    record = np.dtype([("a", "i4"), ("b", "f8")])
+    save(path, np.array([(1, 0.5), (2, 1.5)], dtype=record))
+    append(path, np.array([(3, 2.5)], dtype=record))
+
+    assert read_header(path)["dtype"] == record
+    assert load(path)["b"].tolist() == [0.5, 1.5, 2.5]
+    assert read_rows(path, 1, 3)["a"].tolist() == [2, 3]
+
+
+def test_rejects_0d(tmp_path):
+    with pytest.raises(ValueError):
+        save(tmp_path / "s.npst", np.float64(1.0))
+
+
+def test_rejects_object_dtypes(tmp_path):
+    with pytest.raises(ValueError):
+        save(tmp_path / "o.npst", np.array([1, "abc"], dtype=object))
+    with pytest.raises(ValueError):
+        save(tmp_path / "o.npst", np.zeros(2, dtype=[("a", "i4"), ("b", object)]))
+
+
+def test_append_drops_rows_orphaned_by_a_crash(tmp_path):
+    path = tmp_path / "c.npst"
+    save(path, np.arange(4, dtype=np.int32))
+    with open(path, "ab") as f:
+        f.write(np.array([99, 99], dtype=np.int32).tobytes())  # header never updated
+
+    append(path, np.array([4, 5], dtype=np.int32))
+    assert load(path).tolist() == [0, 1, 2, 3, 4, 5]
+    assert path.stat().st_size == HEADER_SIZE + 6 * 4
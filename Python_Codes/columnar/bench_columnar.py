@@ -0,0 +1,60 @@
+# Run the benchmark as python -m Python_Codes.columnar.bench_columnar
+
+import os
+import random
+import tempfile
+import time
+
+from Python_Codes.csv_io.csv_io import write_rows, read_records
+from Python_Codes.columnar.columnar import convert, ColumnarTable
+
+ROWS = 2_000_000
+DTYPES = (str, "int64", "float64")
+QUERIES = [
+    ("id range (sorted column)", [("id", ">=", 1_000_000), ("id", "<", 1_010_000)]),
+    ("city == 'Agra'", [("city", "==", "Agra")]),
+    ("score > 99.9", [("score", ">", 99.9)]),
+]
+
+
+def rows():
+    rng = random.Random(0)
+    cities = ["Pune", "Delhi", "Agra", "Surat", "Indore", "Nagpur"]
+    for i in range(ROWS):
+        yield [rng.choice(cities), i, rng.random() * 100]
+
+
+def csv_scan(path, where):
+    # rescan the whole CSV and filter row by row
+    checks = [(["city", "id", "score"].index(col), op, value) for col, op, value in where]
+    ops = {"==": lambda a, b: a == b, "<": lambda a, b: a < b, ">=": lambda a, b: a >= b, ">": lambda a, b: a > b}
+    return [r for r in read_records(path, (str, int, float)) if all(ops[op](r[i], v) for i, op, v in checks)]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def run():
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "university_records.csv")
+        table_path = os.path.join(tmp, "table")
+        write_rows(csv_path, rows(), header=["city", "id", "score"])
+
+        _, seconds = timed(lambda: convert(csv_path, table_path, DTYPES))
+        print(f"{ROWS:,} rows, one-time conversion {seconds:.2f} s")
+        print(f"{'Query':<28}{'Matches':<10}{'CSV (s)':<10}{'Columnar (s)':<14}{'Blocks read'}")
+        print("-" * 76)
+
+        table = ColumnarTable(table_path)
+        for label, where in QUERIES:
+            expected, t_csv = timed(lambda: csv_scan(csv_path, where))
+            result, t_col = timed(lambda: table.scan(where=where))
+            assert len(result["id"]) == len(expected)
+            print(f"{label:<28}{len(expected):<10}{t_csv:<10.3f}{t_col:<14.4f}{table.blocks_read}/{table.blocks}")
+
+
+if __name__ == "__main__":
+    run()
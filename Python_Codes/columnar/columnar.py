@@ -0,0 +1,189 @@
+import csv
+import json
+import operator
+import os
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+from Python_Codes.csv_io.csv_io import ENCODING, read_columns
+
+# table folder:  meta.json            rows, block size, per-column dtype and block min/max
+#                <column>.bin         raw values (uint32 codes for string columns)
+#                <column>.dict.json   sorted distinct strings of a string column
+BLOCK_ROWS = 1 << 16
+
+OPS = {"==": operator.eq, "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+
+
+# =========================================CSV -> columns=================================================================
+
+def _block_range(values):
+    # NaN never satisfies a comparison, so it is left out of the block range;
+    # an all-NaN block gets None/None and is skipped by every filter
+    if values.dtype.kind == "f":
+        if np.isnan(values).all():
+            return None, None
+        return np.nanmin(values).item(), np.nanmax(values).item()
+    return values.min().item(), values.max().item()
+
+
+def convert(csv_path, out_dir, dtypes, block_rows=BLOCK_ROWS):
+    # one pass over the CSV; dtypes as for read_columns, str = dictionary-encoded
+    os.makedirs(out_dir, exist_ok=True)
+    meta = {"rows": 0, "blocks": 0, "block_rows": block_rows, "columns": []}
+    files, lookups = {}, {}
+
+    def start(names):
+        for name, dtype in zip(names, dtypes):
+            is_str = dtype is str
+            meta["columns"].append({
+                "name": name,
+                "dtype": "uint32" if is_str else np.dtype(dtype).str,
+                "strings": is_str,
+                "min": [],
+                "max": [],
+            })
+            files[name] = open(os.path.join(out_dir, f"{name}.bin"), "wb")
+            if is_str:
+                lookups[name] = {}
+
+    try:
+        for chunk in read_columns(csv_path, dtypes, chunk_rows=block_rows):
+            if not files:
+                start(chunk)
+
+            for col in meta["columns"]:
+                values = chunk[col["name"]]
+                if col["strings"]:
+                    lookup = lookups[col["name"]]
+                    codes = np.fromiter((lookup.setdefault(v, len(lookup)) for v in values),
+                                        dtype=np.uint32, count=len(values))
+                    files[col["name"]].write(codes)
+                    col["min"].append(min(values))
+                    col["max"].append(max(values))
+                else:
+                    files[col["name"]].write(np.ascontiguousarray(values))
+                    low, high = _block_range(values)
+                    col["min"].append(low)
+                    col["max"].append(high)
+
+            meta["rows"] += len(next(iter(chunk.values())))
+            meta["blocks"] += 1
+
+        if not files:
+            # header only, still write the (empty) columns
+            with open(csv_path, newline="", encoding=ENCODING) as f:
+                start(next(csv.reader(f)))
+    finally:
+        for f in files.values():
+            f.close()
+
+    # sort every dictionary so codes keep the string order, then the block
+    # min/max (and range filters) work on the codes directly
+    for col in meta["columns"]:
+        if not col["strings"]:
+            continue
+        lookup = lookups[col["name"]]
+        words = sorted(lookup)
+        new_code = {w: i for i, w in enumerate(words)}
+        remap = np.empty(len(lookup), dtype=np.uint32)
+        for w, old in lookup.items():
+            remap[old] = new_code[w]
+
+        if meta["rows"]:
+            codes = np.memmap(os.path.join(out_dir, f"{col['name']}.bin"), dtype=np.uint32, mode="r+")
+            codes[:] = remap[codes]
+            codes.flush()
+            del codes
+
+        col["min"] = [new_code[w] for w in col["min"]]
+        col["max"] = [new_code[w] for w in col["max"]]
+        with open(os.path.join(out_dir, f"{col['name']}.dict.json"), "w") as f:
+            json.dump(words, f)
+
+    with open(os.path.join(out_dir, "meta.json"), "w") as f:
+        json.dump(meta, f)
+    return meta
+
+
+# =========================================filtered reads=================================================================
+
+class ColumnarTable:
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, "meta.json")) as f:
+            self.meta = json.load(f)
+        self.rows = self.meta["rows"]
+        self.block_rows = self.meta["block_rows"]
+        self.blocks = self.meta["blocks"]
+        self.columns = {col["name"]: col for col in self.meta["columns"]}
+        self._dicts = {}
+
+    def words(self, name):
+        if name not in self._dicts:
+            with open(os.path.join(self.path, f"{name}.dict.json")) as f:
+                self._dicts[name] = json.load(f)
+        return self._dicts[name]
+
+    def _raw(self, name):
+        # memory-mapped: only the blocks that are sliced get read from disk
+        if not self.rows:
+            return np.zeros(0, dtype=self.columns[name]["dtype"])
+        return np.memmap(os.path.join(self.path, f"{name}.bin"), dtype=self.columns[name]["dtype"], mode="r")
+
+    def _predicate(self, name, op, value):
+        # string values are turned into code comparisons on the sorted dictionary
+        if not self.columns[name]["strings"]:
+            return op, value
+        words = self.words(name)
+        if op == "==":
+            i = bisect_left(words, value)
+            return ("==", i) if i < len(words) and words[i] == value else (None, None)
+        if op in ("<", ">="):
+            return op, bisect_left(words, value)
+        return ("<", bisect_right(words, value)) if op == "<=" else (">=", bisect_right(words, value))
+
+    def _block_may_match(self, name, block, op, value):
+        low, high = self.columns[name]["min"][block], self.columns[name]["max"][block]
+        if low is None:
+            return False  # only NaN in this block
+        if op == "==":
+            return low <= value <= high
+        if op in ("<", "<="):
+            return OPS[op](low, value)
+        return OPS[op](high, value)
+
+    def scan(self, columns=None, where=()):
+        # where: [(column, op, value), ...] all of which must hold
+        columns = columns or list(self.columns)
+        preds = [(name, *self._predicate(name, op, value)) for name, op, value in where]
+        if any(op is None for _, op, _ in preds):
+            preds, blocks = [], []
+        else:
+            blocks = [b for b in range(self.blocks)
+                      if all(self._block_may_match(name, b, op, v) for name, op, v in preds)]
+        self.blocks_read = len(blocks)
+
+        raw = {name: self._raw(name) for name in set(columns) | {p[0] for p in preds}}
+        parts = {name: [] for name in columns}
+
+        for b in blocks:
+            rows = slice(b * self.block_rows, (b + 1) * self.block_rows)
+            mask = None
+            for name, op, value in preds:
+                hit = OPS[op](raw[name][rows], value)
+                mask = hit if mask is None else mask & hit
+            for name in columns:
+                values = raw[name][rows]
+                parts[name].append(np.array(values if mask is None else values[mask]))
+
+        out = {}
+        for name in columns:
+            col = self.columns[name]
+            values = np.concatenate(parts[name]) if parts[name] else np.zeros(0, dtype=col["dtype"])
+            if col["strings"]:
+                values = np.array(self.words(name), dtype=object)[values] if len(values) else np.zeros(0, dtype=object)
+            out[name] = values
+        return out
@@ -0,0 +1,69 @@
+# Run the program as pytest -sv .\test_columnar.py
+
+from Python_Codes.csv_io.csv_io import write_rows, read_records
+from Python_Codes.columnar.columnar import OPS, convert, ColumnarTable
+
+DTYPES = (str, "int64", "float64")
+
+
+def make_csv(path, n=1000):
+    cities = ["Pune", "Delhi", "Agra", "Surat"]
+    # ids are sorted, so the block index can skip on them
+    rows = ([cities[i % 4] if i < n // 2 else "Zirakpur", i, i / 2] for i in range(n))
+    write_rows(path, rows, header=["city", "id", "score"])
+
+
+def expected(path, keep):
+    return [r for r in read_records(path, (str, int, float)) if keep(r)]
+
+
+def as_rows(result):
+    return list(zip(result["city"].tolist(), result["id"].tolist(), result["score"].tolist()))
+
+
+def test_round_trip(tmp_path):
+    make_csv(tmp_path / "u.csv")
+    meta = convert(tmp_path / "u.csv", tmp_path / "table", DTYPES, block_rows=100)
+    assert meta["rows"] == 1000 and meta["blocks"] == 10
+
+    table = ColumnarTable(tmp_path / "table")
+    assert as_rows(table.scan()) == expected(tmp_path / "u.csv", lambda r: True)
+    assert table.words("city") == ["Agra", "Delhi", "Pune", "Surat", "Zirakpur"]
+
+
+def test_filters_skip_blocks(tmp_path):
+    make_csv(tmp_path / "u.csv")
+    convert(tmp_path / "u.csv", tmp_path / "table", DTYPES, block_rows=100)
+    table = ColumnarTable(tmp_path / "table")
+
+    result = table.scan(where=[("id", ">=", 250), ("id", "<", 320)])
+    assert as_rows(result) == expected(tmp_path / "u.csv", lambda r: 250 <= r[1] < 320)
+    assert table.blocks_read == 2
+
+    result = table.scan(["id"], where=[("city", "==", "Zirakpur")])
+    assert result["id"].tolist() == list(range(500, 1000))
+    assert table.blocks_read == 5
+
+    for op, value in (("<", "Delhi"), ("<=", "Delhi"), (">", "Pune"), (">=", "Pune"), ("==", "Bhopal")):
+        got = table.scan(["city", "id", "score"], where=[("city", op, value)])
+        want = expected(tmp_path / "u.csv", lambda r: OPS[op](r[0], value))
+        assert as_rows(got) == want
+
+
+def test_empty_csv(tmp_path):
+    write_rows(tmp_path / "e.csv", [], header=["city", "id", "score"])
+    convert(tmp_path / "e.csv", tmp_path / "table", DTYPES)
+    result = ColumnarTable(tmp_path / "table").scan(where=[("id", ">", 3)])
+    assert len(result["id"]) == 0
+
+
+def test_nan_does_not_hide_blocks(tmp_path):
+    rows = [["a", 0, "nan"], ["b", 1, 5.0], ["c", 2, 6.0], ["d", 3, "nan"], ["e", 4, "nan"]]
+    write_rows(tmp_path / "n.csv", rows, header=["city", "id", "score"])
+    convert(tmp_path / "n.csv", tmp_path / "table", DTYPES, block_rows=3)
+    table = ColumnarTable(tmp_path / "table")
+
+    assert table.scan(["id"], where=[("score", "==", 5.0)])["id"].tolist() == [1]
+    assert table.blocks_read == 1
+    assert table.scan(["id"], where=[("score", ">", 0.0)])["id"].tolist() == [1, 2]
+    assert table.columns["score"]["min"] == [5.0, None]  # second block is all NaN
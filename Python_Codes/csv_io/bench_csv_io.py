@@ -0,0 +1,58 @@
+# Run the benchmark as python -m Python_Codes.csv_io.bench_csv_io
+
+import csv
+import os
+import tempfile
+import time
+
+from Python_Codes.csv_io.csv_io import write_rows, read_records, read_columns, read_parallel
+
+ROWS = 1_000_000
+TYPES = (str, int, float)
+
+
+def rows():
+    for i in range(ROWS):
+        yield [f"student{i}", i % 90, i / 4]
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    print(f"{label:<32}{seconds:<10.3f}{ROWS / seconds:>14,.0f} rows/s")
+
+
+def drain(iterable):
+    for _ in iterable:
+        pass
+
+
+def run():
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, "plain.csv")
+        path = os.path.join(tmp, "batched.csv")
+
+        def plain_write():
+            with open(plain, "w", newline="") as f:
+                writer = csv.writer(f)
+                for row in rows():
+                    writer.writerow(row)
+
+        def plain_read():
+            with open(plain, newline="") as f:
+                reader = csv.reader(f)
+                next(reader)
+                drain((r[0], int(r[1]), float(r[2])) for r in reader)
+
+        print(f"{ROWS:,} rows")
+        timed("csv.writer, row by row", plain_write)
+        timed("write_rows (batched)", lambda: write_rows(path, rows(), header=["name", "age", "score"]))
+        timed("csv.reader + int/float", plain_read)
+        timed("read_records (typed)", lambda: drain(read_records(path, TYPES)))
+        timed("read_columns (NumPy chunks)", lambda: drain(read_columns(path, (str, "int64", "float64"))))
+        timed("read_parallel (typed)", lambda: drain(read_parallel(path, TYPES)))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,145 @@
+import csv
+import io
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+BATCH_ROWS = 10000
+BUFFER = 1 << 20  # file buffer size in bytes
+RANGE_BYTES = 8 << 20  # bytes parsed per parallel task
+ENCODING = "utf-8"  # same for every reader and writer, whatever the locale
+
+
+def _batches(rows, size):
+    it = iter(rows)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+# =========================================writing========================================================================
+
+def write_rows(path, rows, header=None, batch_size=BATCH_ROWS, append=False):
+    # rows can be any iterable or generator; only one batch is held at a time
+    count = 0
+    with open(path, "a" if append else "w", newline="", buffering=BUFFER, encoding=ENCODING) as f:
+        writer = csv.writer(f)
+        if header:
+            writer.writerow(header)
+        for batch in _batches(rows, batch_size):
+            writer.writerows(batch)
+            count += len(batch)
+    return count
+
+
+# =========================================reading========================================================================
+
+def _converter(types):
+    # row -> tuple with one type applied per column; str columns are left
+    # alone, so the per-row loop only visits the columns that need parsing
+    if types is None:
+        return None
+    typed = [(i, t) for i, t in enumerate(types) if t is not str]
+
+    def convert(row):
+        for i, t in typed:
+            row[i] = t(row[i])
+        return tuple(row)
+
+    return convert
+
+
+def _checked_rows(reader, width, where):
+    # skips blank lines; rows with the wrong number of columns are an error
+    # (width None: not known, anything goes)
+    for row in reader:
+        if not row:
+            continue
+        if width is not None and len(row) != width:
+            raise ValueError(f"{where}, line {reader.line_num}: expected {width} columns, got {len(row)}")
+        yield row
+
+
+def read_records(path, types=None, header=True):
+    # streaming reader; types = one callable per column, e.g. (str, int, float)
+    convert = _converter(types)
+    with open(path, newline="", buffering=BUFFER, encoding=ENCODING) as f:
+        reader = csv.reader(f)
+        names = next(reader, None) if header else None
+        width = len(types) if types else len(names) if names else None
+        reader = _checked_rows(reader, width, path)
+        if convert is None:
+            yield from reader
+        else:
+            yield from map(convert, reader)
+
+
+def _to_columns(rows, names, dtypes):
+    import numpy as np
+
+    # transpose once, then let NumPy parse each column in bulk
+    columns = list(zip(*rows)) if rows else [()] * len(names)
+    return {
+        name: np.array(col, dtype=object if dtype is str else dtype)
+        for name, col, dtype in zip(names, columns, dtypes)
+    }
+
+
+def read_columns(path, dtypes, chunk_rows=100000, header=True):
+    # yields {column name: NumPy array} for every chunk_rows rows
+    with open(path, newline="", buffering=BUFFER, encoding=ENCODING) as f:
+        reader = csv.reader(f)
+        names = next(reader) if header else [f"col{i}" for i in range(len(dtypes))]
+        for batch in _batches(_checked_rows(reader, len(dtypes), path), chunk_rows):
+            yield _to_columns(batch, names, dtypes)
+
+
+# =========================================parallel reading===============================================================
+
+def split_ranges(path, parts):
+    # byte ranges that start and end on line boundaries
+    # (assumes no newlines inside quoted fields)
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            f.seek(max(size * i // parts, bounds[-1]))
+            f.readline()
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+
+def _parse_range(args):
+    path, start, end, types, skip_header = args
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode(ENCODING)
+
+    reader = csv.reader(io.StringIO(text, newline=""))
+    if skip_header:
+        next(reader, None)
+    # line numbers count from the start of this slice
+    rows = _checked_rows(reader, len(types) if types else None, f"{path} (slice at byte {start})")
+    convert = _converter(types)
+    return [convert(row) for row in rows] if convert else list(rows)
+
+
+def read_parallel(path, types=None, header=True, workers=None, range_bytes=RANGE_BYTES):
+    # the file is cut into ~range_bytes slices parsed by a pool of workers;
+    # rows come back in file order and at most 2 slices per worker are in
+    # flight, so memory stays bounded whatever the file size
+    workers = workers or os.cpu_count() or 1
+    parts = max(workers, -(-os.path.getsize(path) // range_bytes))
+    tasks = iter([(path, a, b, types, header and a == 0) for a, b in split_ranges(path, parts)])
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque(pool.submit(_parse_range, t) for t in islice(tasks, 2 * workers))
+        while pending:
+            rows = pending.popleft().result()
+            for task in islice(tasks, 1):
+                pending.append(pool.submit(_parse_range, task))
+            yield from rows
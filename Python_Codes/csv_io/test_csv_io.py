@@ -0,0 +1,82 @@
+# Run the program as pytest -sv .\test_csv_io.py
+
+import pytest
+
+from Python_Codes.csv_io.csv_io import (
+    write_rows,
+    read_records,
+    read_columns,
+    read_parallel,
+    split_ranges,
+)
+
+HEADER = ["name", "age", "score"]
+TYPES = (str, int, float)
+
+
+def people(n):
+    # a generator, never a full list
+    for i in range(n):
+        yield [f"student, {i}", i % 90, i / 4]
+
+
+def test_write_and_read_typed(tmp_path):
+    path = tmp_path / "university_records.csv"
+    assert write_rows(path, people(2500), header=HEADER, batch_size=1000) == 2500
+
+    records = list(read_records(path, TYPES))
+    assert len(records) == 2500
+    assert records[5] == ("student, 5", 5, 1.25)
+    assert list(read_records(path, header=False))[0] == HEADER
+
+
+def test_append(tmp_path):
+    path = tmp_path / "r.csv"
+    write_rows(path, people(3), header=HEADER)
+    write_rows(path, people(2), append=True)
+    assert len(list(read_records(path))) == 5
+
+
+def test_column_chunks(tmp_path):
+    path = tmp_path / "r.csv"
+    write_rows(path, people(250), header=HEADER)
+
+    chunks = list(read_columns(path, dtypes=(str, "int64", "float64"), chunk_rows=100))
+    assert [len(c["age"]) for c in chunks] == [100, 100, 50]
+    assert chunks[2]["score"][-1] == 249 / 4
+    assert chunks[0]["name"][1] == "student, 1"
+
+
+def test_parallel_matches_serial(tmp_path):
+    path = tmp_path / "r.csv"
+    write_rows(path, people(1000), header=HEADER)
+
+    ranges = split_ranges(path, 4)
+    assert ranges[0][0] == 0 and ranges[-1][1] == path.stat().st_size
+    assert list(read_parallel(path, TYPES, workers=3)) == list(read_records(path, TYPES))
+    assert list(read_parallel(path, TYPES, workers=2, range_bytes=1000)) == list(read_records(path, TYPES))
+
+
+def test_non_ascii_is_utf8_everywhere(tmp_path):
+    path = tmp_path / "r.csv"
+    rows = [["Jürgen, Ω", 30, 1.5], ["Zoë", 21, 2.0]]
+    write_rows(path, rows, header=HEADER)
+
+    assert path.read_bytes().decode("utf-8").splitlines()[1] == '"Jürgen, Ω",30,1.5'
+    expected = [tuple(r) for r in rows]
+    assert list(read_records(path, TYPES)) == expected
+    assert list(read_parallel(path, TYPES, workers=2)) == expected
+
+
+def test_blank_lines_and_bad_rows(tmp_path):
+    path = tmp_path / "b.csv"
+    path.write_text("name,age\na,1\nb,2\n\nc,3\n", encoding="utf-8")
+    assert list(read_records(path, (str, int))) == [("a", 1), ("b", 2), ("c", 3)]
+    assert list(read_parallel(path, (str, int), workers=2)) == [("a", 1), ("b", 2), ("c", 3)]
+    (chunk,) = read_columns(path, (str, "int64"))
+    assert chunk["age"].tolist() == [1, 2, 3]
+
+    path.write_text("name,age\na,1\nb\n", encoding="utf-8")
+    for read in (lambda: list(read_records(path)), lambda: list(read_columns(path, (str, "int64")))):
+        with pytest.raises(ValueError, match="line 3"):
+            read()
@@ -0,0 +1,57 @@
+# Run the benchmark as python -m Python_Codes.email_validation.bench_email_validation
+
+import os
+import random
+import tempfile
+import time
+
+from Python_Codes.email_validation.email_validation import (
+    validate_batch,
+    validate_file,
+    validate_file_parallel,
+)
+
+COUNT = 2_000_000
+
+
+def old_validator(email):
+    if any(ch.isupper() for ch in email):
+        return "uppercase"
+    elif " " in email:
+        return "space"
+    elif "@" in email and "." in email:
+        return "valid"
+    return "missing_at_or_dot"
+
+
+def make_emails(n):
+    rng = random.Random(0)
+    names = ["naman", "alice", "Bob", "carol x", "dave"]
+    domains = ["gmail.com", "example.org", "mailcom"]
+    return [f"{rng.choice(names)}{i}@{rng.choice(domains)}" for i in range(n)]
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    print(f"{label:<30}{seconds:<10.3f}{COUNT / seconds:>14,.0f} emails/s")
+
+
+def run():
+    emails = make_emails(COUNT)
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "list.txt")
+        with open(src, "w") as f:
+            f.write("\n".join(emails) + "\n")
+        ok, bad = os.path.join(tmp, "ok.txt"), os.path.join(tmp, "bad.txt")
+
+        print(f"{COUNT:,} addresses")
+        timed("old any()/in checks", lambda: [old_validator(e) for e in emails])
+        timed("validate_batch", lambda: validate_batch(emails))
+        timed("validate_file", lambda: validate_file(src, ok, bad))
+        timed("validate_file_parallel", lambda: validate_file_parallel(src, ok, bad))
+
+
+if __name__ == "__main__":
+    run()
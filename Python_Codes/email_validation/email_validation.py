@@ -0,0 +1,111 @@
+import os
+import shutil
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# reason codes, checked in the same order as Email_Validator.py
+VALID = "valid"
+UPPERCASE = "uppercase"
+SPACE = "space"
+MISSING_AT_OR_DOT = "missing_at_or_dot"
+NOT_UTF8 = "not_utf8"  # files only: the line is not valid UTF-8
+
+MESSAGES = {
+    VALID: "Valid email address",
+    UPPERCASE: "Invalid Email: uppercase not allowed",
+    SPACE: "Invalid Email: space not allowed",
+    MISSING_AT_OR_DOT: "Invalid Email: missing @ or .",
+    NOT_UTF8: "Invalid Email: not valid UTF-8",
+}
+
+def validate(email):
+    # ASCII fast path: lower() only changes A-Z, so a change means uppercase
+    if email.isascii():
+        has_upper = email != email.lower()
+    else:
+        has_upper = any(ch.isupper() for ch in email)
+
+    if has_upper:
+        return UPPERCASE
+    if " " in email:
+        return SPACE
+    if "@" in email and "." in email:
+        return VALID
+    return MISSING_AT_OR_DOT
+
+
+def validate_batch(emails):
+    return [validate(e) for e in emails]
+
+
+# =========================================files==========================================================================
+
+def validate_file(in_path, valid_path, invalid_path, start=0, end=None):
+    # one address per line, streamed; valid ones go to valid_path, the rest
+    # to invalid_path as "email,reason" (only "\r\n" / "\n" are stripped)
+    # start/end: a byte range that begins and ends on line boundaries
+    counts = Counter()
+    with open(in_path, "rb") as raw, \
+            open(valid_path, "w", encoding="utf-8", buffering=1 << 20) as ok, \
+            open(invalid_path, "w", encoding="utf-8", buffering=1 << 20) as bad:
+        raw.seek(start)
+        pos = start
+
+        for line in raw:
+            if end is not None and pos >= end:
+                break
+            pos += len(line)
+
+            try:
+                email = line.decode("utf-8").rstrip("\r\n")
+                reason = validate(email)
+            except UnicodeDecodeError:
+                # one corrupt line must not abort the run; bad bytes are
+                # written out as \xNN escapes
+                email = line.decode("utf-8", "backslashreplace").rstrip("\r\n")
+                reason = NOT_UTF8
+            counts[reason] += 1
+            if reason == VALID:
+                ok.write(email + "\n")
+            else:
+                bad.write(f"{email},{reason}\n")
+    return counts
+
+
+def _line_ranges(path, parts):
+    # byte ranges of the file that start and end on line boundaries
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            f.seek(max(size * i // parts, bounds[-1]))
+            f.readline()
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+
+def _validate_part(args):
+    return validate_file(*args)
+
+
+def validate_file_parallel(in_path, valid_path, invalid_path, workers=None):
+    # every worker validates one line-aligned slice into its own part files,
+    # which are then stitched together in order
+    workers = workers or os.cpu_count() or 1
+    ranges = _line_ranges(in_path, workers)
+    parts = [(in_path, f"{valid_path}.part{i}", f"{invalid_path}.part{i}", a, b)
+             for i, (a, b) in enumerate(ranges)]
+
+    counts = Counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for partial in pool.map(_validate_part, parts):
+            counts.update(partial)
+
+    for index, out_path in ((1, valid_path), (2, invalid_path)):
+        with open(out_path, "wb") as out:
+            for part in parts:
+                with open(part[index], "rb") as f:
+                    shutil.copyfileobj(f, out)
+                os.remove(part[index])
+    return counts
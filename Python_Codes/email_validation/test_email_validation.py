@@ -0,0 +1,79 @@
+# Run the program as pytest -sv .\test_email_validation.py
+
+from Python_Codes.email_validation.email_validation import (
+    VALID,
+    UPPERCASE,
+    SPACE,
+    MISSING_AT_OR_DOT,
+    NOT_UTF8,
+    validate,
+    validate_batch,
+    validate_file,
+    validate_file_parallel,
+)
+
+CASES = {
+    "naman@gmail.com": VALID,
+    "Naman@gmail.com": UPPERCASE,
+    "naman @gmail.com": SPACE,
+    "Naman @gmail.com": UPPERCASE,  # uppercase is checked first
+    "namangmail.com": MISSING_AT_OR_DOT,
+    "naman@gmailcom": MISSING_AT_OR_DOT,
+    "ünïcode@exämple.de": VALID,
+    "ÉCOLE@example.fr": UPPERCASE,
+    "": MISSING_AT_OR_DOT,
+}
+
+
+def old_validator(email):
+    # the rules from Email_Validator.py
+    if any(ch.isupper() for ch in email):
+        return UPPERCASE
+    elif " " in email:
+        return SPACE
+    elif "@" in email and "." in email:
+        return VALID
+    else:
+        return MISSING_AT_OR_DOT
+
+
+def test_same_rules_as_script():
+    for email, reason in CASES.items():
+        assert validate(email) == reason == old_validator(email)
+    assert validate_batch(list(CASES)) == list(CASES.values())
+
+
+def test_files(tmp_path):
+    emails = list(CASES) * 50
+    src = tmp_path / "list.txt"
+    src.write_text("\n".join(emails) + "\n", encoding="utf-8")
+
+    for run in (validate_file, lambda *p: validate_file_parallel(*p, workers=3)):
+        counts = run(src, tmp_path / "ok.txt", tmp_path / "bad.txt")
+        assert counts[VALID] == 100 and sum(counts.values()) == len(emails)
+
+        ok = (tmp_path / "ok.txt").read_text(encoding="utf-8").splitlines()
+        bad = (tmp_path / "bad.txt").read_text(encoding="utf-8").splitlines()
+        assert ok == [e for e in emails if CASES[e] == VALID]
+        assert bad == [f"{e},{CASES[e]}" for e in emails if CASES[e] != VALID]
+
+
+def test_file_splits_on_newlines_only(tmp_path):
+    src = tmp_path / "list.txt"
+    src.write_bytes("x\u0085y@z.com\r\nab\u2028c@d.e\n".encode("utf-8"))
+
+    counts = validate_file(src, tmp_path / "ok.txt", tmp_path / "bad.txt")
+    assert counts == {VALID: 2}
+    ok = (tmp_path / "ok.txt").read_text(encoding="utf-8").split("\n")
+    assert ok == ["x\u0085y@z.com", "ab\u2028c@d.e", ""]
+
+
+def test_undecodable_lines_are_reported(tmp_path):
+    src = tmp_path / "list.txt"
+    src.write_bytes(b"a@b.com\n\xff\xfe@x.com\nc@d.com\n" * 20)
+
+    for run in (validate_file, lambda *p: validate_file_parallel(*p, workers=3)):
+        counts = run(src, tmp_path / "ok.txt", tmp_path / "bad.txt")
+        assert counts == {VALID: 40, NOT_UTF8: 20}
+        bad = (tmp_path / "bad.txt").read_text(encoding="utf-8").splitlines()
+        assert bad[0] == "\\xff\\xfe@x.com,not_utf8"
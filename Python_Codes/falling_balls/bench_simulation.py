@@ -0,0 +1,52 @@
+# Run the benchmark as python -m Python_Codes.falling_balls.bench_simulation
+
+import time
+
+import numpy as np
+
+from Python_Codes.falling_balls.simulation import BallWorld
+
+SIZES = [100, 1000, 10000, 100000]
+FRAMES = 200
+
+
+def list_step(balls, player_x, speed=1.5, height=600, top=570, width=100):
+    # the old square_bounce.py frame: one Python iteration per ball
+    new_balls = []
+    for ball in balls:
+        ball[1] += speed
+        if ball[1] >= top and player_x <= ball[0] <= player_x + width:
+            pass
+        elif ball[1] < height:
+            new_balls.append(ball)
+    return new_balls
+
+
+def run():
+    rng = np.random.default_rng(0)
+    print(f"{'balls':<10}{'list ms/frame':<16}{'numpy ms/frame':<16}")
+    print("-" * 42)
+
+    for n in SIZES:
+        xs = rng.integers(0, 781, n).astype(float)
+        ys = rng.uniform(0, 300, n)
+
+        balls = [[x, y] for x, y in zip(xs.tolist(), ys.tolist())]
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            balls = list_step(balls, 350)
+        old = (time.perf_counter() - start) / FRAMES
+
+        world = BallWorld(spawn_interval=10**9, lives=10**9, capacity=n)
+        world.frame = 1  # no automatic spawns
+        world.spawn(xs, ys)
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            world.step()
+        new = (time.perf_counter() - start) / FRAMES
+
+        print(f"{n:<10}{old * 1e3:<16.3f}{new * 1e3:<16.3f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,72 @@
+# Run the benchmark as python -m Python_Codes.falling_balls.bench_spatial_hash
+
+import time
+
+import numpy as np
+
+from Python_Codes.falling_balls.spatial_hash import (
+    SpatialHash,
+    brute_touching_pairs,
+    paddle_hits,
+    touching_pairs,
+)
+
+SIZES = [100, 1000, 10000]
+WIDTH, HEIGHT, RADIUS = 800, 600, 10
+PADDLES = [(x, y, 100, 20) for x in range(0, 800, 200) for y in (150, 450)]
+
+
+def brute_paddle_hits(pos, radius, paddles):
+    # every ball against every paddle
+    balls, owners = [], []
+    for k, (x, y, w, h) in enumerate(paddles):
+        dx = pos[:, 0] - np.clip(pos[:, 0], x, x + w)
+        dy = pos[:, 1] - np.clip(pos[:, 1], y, y + h)
+        hit = np.flatnonzero(dx * dx + dy * dy <= radius**2)
+        balls.append(hit)
+        owners.append(np.full(len(hit), k))
+    return np.concatenate(balls), np.concatenate(owners)
+
+
+def grid_paddle_hits(grid, pos, radius, paddles):
+    return paddle_hits(pos, radius, paddles, grid.build(pos))
+
+
+def timed(fn, *args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run():
+    rng = np.random.default_rng(0)
+    grid = SpatialHash(2 * RADIUS, WIDTH, HEIGHT)
+    print("ball-ball")
+    print(f"{'balls':<10}{'pairs':<10}{'candidates':<12}{'brute ms':<12}{'grid ms':<12}{'speedup':<8}")
+    print("-" * 64)
+
+    for n in SIZES:
+        pos = rng.uniform(0, 1, (n, 2)) * [WIDTH, HEIGHT]
+        brute, expected = timed(brute_touching_pairs, pos, RADIUS)
+        fast, found = timed(touching_pairs, pos, RADIUS, grid)
+        assert np.array_equal(expected, found)
+        candidates = len(grid.build(pos).pairs()[0])
+        print(f"{n:<10}{len(found):<10}{candidates:<12}{brute * 1e3:<12.3f}{fast * 1e3:<12.3f}{brute / fast:<8.1f}")
+
+    print(f"\nball-paddle ({len(PADDLES)} paddles, grid time includes the rebuild)")
+    print(f"{'balls':<10}{'hits':<10}{'brute ms':<12}{'grid ms':<12}{'speedup':<8}")
+    print("-" * 52)
+
+    for n in SIZES:
+        pos = rng.uniform(0, 1, (n, 2)) * [WIDTH, HEIGHT]
+        brute, expected = timed(brute_paddle_hits, pos, RADIUS, PADDLES)
+        fast, found = timed(grid_paddle_hits, grid, pos, RADIUS, PADDLES)
+        assert sorted(zip(*map(np.ndarray.tolist, expected))) == sorted(zip(*map(np.ndarray.tolist, found)))
+        print(f"{n:<10}{len(found[0]):<10}{brute * 1e3:<12.3f}{fast * 1e3:<12.3f}{brute / fast:<8.1f}")
+
+
+if __name__ == "__main__":
+    run()
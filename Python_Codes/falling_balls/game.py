@@ -0,0 +1,187 @@
+import pygame
+
+from .render_cache import FontCache, TextCache, ball_sprite
+from .simulation import BallWorld, WIDTH, HEIGHT
+
+# Colors
+WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+
+
+def keyboard_input(frame):
+    # -1 for A, +1 for D, 0 for both or neither
+    keys = pygame.key.get_pressed()
+    return keys[pygame.K_d] - keys[pygame.K_a]
+
+
+MAX_UPDATE_RECTS = 512  # beyond this many dirty rects, redraw and flip the whole screen
+
+
+class Renderer:
+    # draws a world; fonts, text and the ball sprite are built once
+
+    def __init__(self, screen, world):
+        self.screen = screen
+        self.fonts = FontCache()
+        self.text = TextCache(self.fonts.get(36))
+        self.ball = ball_sprite(world.ball_radius, RED)
+
+    def corners(self, world):
+        # top-left corner of every ball sprite
+        return (world.balls - world.ball_radius).astype(int)
+
+    def draw(self, world):
+        self.screen.fill(WHITE)
+        self.draw_items(world, self.corners(world).tolist())
+
+    def draw_items(self, world, corners):
+        # draws player, balls and text; returns the rects of the non-ball items
+        screen = self.screen
+
+        # Draw player
+        rects = [
+            pygame.draw.rect(screen, BLUE, (world.player_x, world.player_y, world.player_width, world.player_height))
+        ]
+
+        # Draw balls: one blits() call with the top-left corner of every sprite
+        ball = self.ball
+        screen.blits([(ball, corner) for corner in corners], doreturn=False)
+
+        # Display score and lives
+        rects.append(screen.blit(self.text.render(f"Score: {world.score}", (0, 0, 0)), (10, 10)))
+        rects.append(screen.blit(self.text.render(f"Lives: {world.lives}", (0, 0, 0)), (WIDTH - 100, 10)))
+        return rects
+
+    def invalidate(self):
+        pass
+
+    def present(self):
+        pygame.display.flip()
+
+
+class DirtyRenderer(Renderer):
+    # erases and redraws only what was drawn last frame and is drawn now,
+    # updates only those regions, and presents nothing when the frame is
+    # identical to the previous one
+
+    def __init__(self, screen, world):
+        super().__init__(screen, world)
+        # a background-coloured ball: erases exactly the old circle and, being
+        # run-length encoded like the ball, blits as fast as drawing one
+        self.eraser = ball_sprite(world.ball_radius, WHITE)
+        self._state = None  # what the screen currently shows
+        self._corners = []
+        self._rects = []
+        self._update = None  # rects for present(), None = whole screen
+        self.skipped = 0
+
+    def invalidate(self):
+        # the window contents were lost (exposed, resized): redraw everything
+        self._state = None
+
+    def draw(self, world):
+        if world.n + len(self._corners) > MAX_UPDATE_RECTS:
+            # too many regions to track: plain full redraw, no state kept
+            super().draw(world)
+            self._state = None
+            self._corners = []
+            self._update = None
+            return
+
+        corners = self.corners(world)
+        state = (world.player_x, world.score, world.lives, corners.tobytes())
+        if state == self._state:
+            self._update = []
+            self.skipped += 1
+            return
+
+        screen = self.screen
+        corners = corners.tolist()
+        if self._state is None:
+            screen.fill(WHITE)
+            update = None
+        else:
+            for rect in self._rects:
+                screen.fill(WHITE, rect)
+            eraser = self.eraser
+            screen.blits([(eraser, corner) for corner in self._corners], doreturn=False)
+            update = self._rects + self._balls_rects(self._corners)
+
+        self._rects = self.draw_items(world, corners)
+        self._corners = corners
+        self._state = state
+        if update is not None:
+            update += self._rects + self._balls_rects(corners)
+        self._update = update
+
+    def _balls_rects(self, corners):
+        w, h = self.ball.get_size()
+        return [(x, y, w, h) for x, y in corners]
+
+    def present(self):
+        update = self._update
+        if update is None or len(update) > MAX_UPDATE_RECTS:
+            pygame.display.flip()
+        elif update:
+            pygame.display.update(update)
+
+
+def run(world=None, frames=None, inputs=keyboard_input, timer=None, fps=60, dirty=False):
+    # frames: stop after this many frames (None = until quit or game over)
+    # inputs: frame number -> player direction, or a sequence of directions
+    # timer:  gets start() once per frame and mark("update"/"draw"/"flip")
+    # fps:    frame cap, 0 runs as fast as possible
+    # dirty:  redraw and present only the regions that changed
+    if world is None:
+        world = BallWorld(
+            ball_speed=1.5,  # Extremely reduced speed of the balls
+            spawn_interval=100,  # Further increased interval to drastically reduce ball quantity
+        )
+    if not callable(inputs):
+        inputs = inputs.__getitem__
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Falling Balls Game")
+
+    renderer = (DirtyRenderer if dirty else Renderer)(screen, world)
+
+    # Game loop
+    running = True
+    clock = pygame.time.Clock()
+    frame = 0
+
+    while running and (frames is None or frame < frames):
+        if timer:
+            timer.start()
+
+        # Event handling
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                renderer.invalidate()
+
+        # Player movement, spawning, ball movement and collisions
+        world.step(inputs(frame))
+        if timer:
+            timer.mark("update")
+
+        renderer.draw(world)
+        if timer:
+            timer.mark("draw")
+
+        renderer.present()
+        if timer:
+            timer.mark("flip")
+
+        # Game over check
+        if world.game_over:
+            running = False
+
+        clock.tick(fps)
+        frame += 1
+
+    pygame.quit()
+    return world
@@ -0,0 +1,65 @@
+from collections import OrderedDict
+
+import pygame
+
+# Surfaces that used to be rebuilt every frame are built once and reused
+
+
+class FontCache:
+    # one pygame Font per (file, size); building a Font reads the font file
+
+    def __init__(self):
+        self._fonts = {}
+
+    def get(self, size, name=None):
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = pygame.font.Font(name, size)
+        return font
+
+
+class TextCache:
+    # LRU of rendered text surfaces keyed on (text, colour); a score that
+    # did not change since the last frame is a dict lookup, not a render
+
+    def __init__(self, font, maxsize=128, antialias=True):
+        self.font = font
+        self.maxsize = maxsize
+        self.antialias = antialias
+        self._surfaces = OrderedDict()
+        self.hits = self.misses = 0
+
+    def render(self, text, colour):
+        key = (text, colour)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self._surfaces[key] = self.font.render(text, self.antialias, colour)
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surface
+
+
+def load_image(path, alpha=True):
+    # convert to the display's pixel format once, so blits are plain copies;
+    # needs pygame.display.set_mode() to have been called
+    image = path if isinstance(path, pygame.Surface) else pygame.image.load(path)
+    return image.convert_alpha() if alpha else image.convert()
+
+
+def ball_sprite(radius, colour):
+    # the circle rasterised once; the colour key makes the corners transparent
+    # without per-pixel alpha, and RLE speeds up the skipped pixels
+    key = (0, 0, 0) if colour != (0, 0, 0) else (255, 255, 255)
+    sprite = pygame.Surface((2 * radius, 2 * radius))
+    sprite.fill(key)
+    pygame.draw.circle(sprite, colour, (radius, radius), radius)
+    sprite.set_colorkey(key, pygame.RLEACCEL)
+    if pygame.display.get_surface() is not None:
+        sprite = sprite.convert()
+    return sprite
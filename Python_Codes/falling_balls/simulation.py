@@ -0,0 +1,141 @@
+import numpy as np
+
+from .spatial_hash import SpatialHash, paddle_hits, touching_pairs
+
+# Game rules from square_bounce.py, without any pygame: the whole state is a
+# few NumPy arrays, so thousands of balls cost one vectorized pass per frame
+
+WIDTH, HEIGHT = 800, 600
+FIXED_DT = 1 / 60  # seconds per simulation step (the old clock.tick(60))
+
+
+class BallWorld:
+
+    def __init__(
+        self,
+        width=WIDTH,
+        height=HEIGHT,
+        player_width=100,
+        player_height=20,
+        player_speed=5,
+        ball_radius=10,
+        ball_speed=1.5,
+        spawn_interval=100,
+        spawn_count=1,
+        lives=3,
+        capacity=1024,
+        seed=None,
+    ):
+        self.width, self.height = width, height
+        self.player_width, self.player_height = player_width, player_height
+        self.player_speed = player_speed
+        self.player_x = width // 2 - player_width // 2
+        self.player_y = height - player_height - 10
+        self.ball_radius = ball_radius
+        self.ball_speed = ball_speed
+        self.spawn_interval = spawn_interval
+        self.spawn_count = spawn_count
+        self.rng = np.random.default_rng(seed)
+
+        # ball i lives in row i of pos/vel for i < n; rows >= n are free
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.n = 0
+
+        # broad phase for ball-ball and ball-paddle contacts
+        self.grid = SpatialHash(2 * ball_radius, width, height)
+
+        self.score = 0
+        self.lives = lives
+        self.frame = 0
+        self._time = 0.0
+
+    @property
+    def balls(self):
+        return self.pos[: self.n]
+
+    @property
+    def game_over(self):
+        return self.lives <= 0
+
+    # =========================================entities===================================================================
+
+    def spawn(self, xs, ys=None, vx=0.0, vy=None):
+        xs = np.atleast_1d(np.asarray(xs, dtype=float))
+        count = len(xs)
+        self._reserve(self.n + count)
+
+        new = slice(self.n, self.n + count)
+        self.pos[new, 0] = xs
+        self.pos[new, 1] = 0.0 if ys is None else ys
+        self.vel[new, 0] = vx
+        self.vel[new, 1] = self.ball_speed if vy is None else vy
+        self.n += count
+
+    def _reserve(self, size):
+        if size > len(self.pos):
+            capacity = max(size, 2 * len(self.pos))
+            for name in ("pos", "vel"):
+                grown = np.zeros((capacity, 2))
+                grown[: self.n] = getattr(self, name)[: self.n]
+                setattr(self, name, grown)
+
+    def remove(self, dead):
+        # swap-remove: survivors from the tail fill the holes in the front,
+        # so only as many rows move as were removed
+        keep = self.n - int(dead.sum())
+        holes = np.flatnonzero(dead[:keep])
+        fillers = np.flatnonzero(~dead[keep:]) + keep
+        self.pos[holes] = self.pos[fillers]
+        self.vel[holes] = self.vel[fillers]
+        self.n = keep
+
+    def touching_pairs(self):
+        # (k, 2) array of overlapping ball index pairs
+        return touching_pairs(self.balls, self.ball_radius, self.grid)
+
+    def paddle_contacts(self, paddles):
+        # (ball, paddle) index arrays for balls overlapping any of the
+        # (x, y, width, height) paddle rectangles
+        return paddle_hits(self.balls, self.ball_radius, paddles, self.grid.build(self.balls))
+
+    # =========================================stepping===================================================================
+
+    def move_player(self, direction):
+        # direction: -1 left (A), +1 right (D), 0 stay
+        if direction < 0 and self.player_x > 0:
+            self.player_x -= self.player_speed
+        if direction > 0 and self.player_x < self.width - self.player_width:
+            self.player_x += self.player_speed
+
+    def step(self, direction=0):
+        # one fixed-timestep frame, same order as the old game loop
+        self.move_player(direction)
+
+        if self.frame % self.spawn_interval == 0:
+            high = self.width - self.ball_radius * 2
+            self.spawn(self.rng.integers(0, high + 1, self.spawn_count))
+        self.frame += 1
+
+        balls = self.pos[: self.n]
+        balls += self.vel[: self.n]
+
+        x, y = balls[:, 0], balls[:, 1]
+        caught = (y >= self.height - self.player_height - 10) & (x >= self.player_x) & (
+            x <= self.player_x + self.player_width
+        )
+        floor = ~caught & (y >= self.height)
+
+        self.score += int(caught.sum())
+        self.lives -= int(floor.sum())
+        self.remove(caught | floor)
+
+    def advance(self, seconds, direction=0):
+        # run as many fixed steps as fit into the elapsed real time
+        self._time += seconds
+        steps = 0
+        while self._time >= FIXED_DT and not self.game_over:
+            self._time -= FIXED_DT
+            self.step(direction)
+            steps += 1
+        return steps
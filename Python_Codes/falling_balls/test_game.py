@@ -0,0 +1,64 @@
+# Run the program as pytest -sv .\test_game.py
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from Python_Codes.falling_balls.game import MAX_UPDATE_RECTS, DirtyRenderer, Renderer, run
+from Python_Codes.falling_balls.simulation import BallWorld, WIDTH, HEIGHT
+
+
+@pytest.fixture
+def display():
+    pygame.init()
+    yield pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.quit()
+
+
+def test_dirty_renderer_matches_full_redraw(display):
+    world = BallWorld(spawn_interval=3, seed=4)
+    full = Renderer(pygame.Surface((WIDTH, HEIGHT)), world)
+    dirty = DirtyRenderer(pygame.Surface((WIDTH, HEIGHT)), world)
+
+    for frame in range(500):
+        world.step(1 if frame % 200 < 100 else -1)
+        full.draw(world)
+        dirty.draw(world)
+        if frame % 50 == 0:
+            assert pygame.image.tobytes(full.screen, "RGB") == pygame.image.tobytes(dirty.screen, "RGB")
+
+
+def test_many_balls_fall_back_to_full_redraw(display):
+    world = BallWorld(seed=1)
+    world.spawn(range(MAX_UPDATE_RECTS), ys=range(MAX_UPDATE_RECTS))
+    full = Renderer(pygame.Surface((WIDTH, HEIGHT)), world)
+    dirty = DirtyRenderer(pygame.Surface((WIDTH, HEIGHT)), world)
+
+    for frame in range(300):
+        world.step()
+        full.draw(world)
+        dirty.draw(world)
+        if frame % 50 == 0:
+            assert pygame.image.tobytes(full.screen, "RGB") == pygame.image.tobytes(dirty.screen, "RGB")
+    assert world.n < MAX_UPDATE_RECTS // 2 and dirty._update is not None
+
+
+def test_identical_frames_are_skipped(display):
+    world = BallWorld()
+    renderer = DirtyRenderer(display, world)
+    renderer.draw(world)
+    renderer.draw(world)
+    assert renderer.skipped == 1 and renderer._update == []
+
+    renderer.invalidate()
+    renderer.draw(world)
+    assert renderer.skipped == 1 and renderer._update is None
+
+
+def test_run_scripted(display):
+    world = run(BallWorld(spawn_interval=5, seed=0), frames=200, inputs=[1] * 200, fps=0, dirty=True)
+    assert world.frame == 200
+    assert world.player_x == WIDTH - world.player_width
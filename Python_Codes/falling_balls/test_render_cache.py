@@ -0,0 +1,46 @@
+# Run the program as pytest -sv .\test_render_cache.py
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from Python_Codes.falling_balls.render_cache import FontCache, TextCache, ball_sprite, load_image
+
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    yield pygame.display.set_mode((64, 64))
+    pygame.quit()
+
+
+def test_font_and_text_cache(screen):
+    fonts = FontCache()
+    assert fonts.get(36) is fonts.get(36)
+
+    text = TextCache(fonts.get(36), maxsize=2)
+    first = text.render("Score: 0", (0, 0, 0))
+    assert text.render("Score: 0", (0, 0, 0)) is first
+    assert text.render("Score: 0", (255, 0, 0)) is not first
+    text.render("Score: 1", (0, 0, 0))
+    assert text.render("Score: 0", (0, 0, 0)) is not first  # evicted
+    assert (text.hits, text.misses) == (1, 4)
+
+
+def test_ball_sprite(screen):
+    sprite = ball_sprite(10, (255, 0, 0))
+    assert sprite.get_size() == (20, 20)
+    assert sprite.get_at((10, 10))[:3] == (255, 0, 0)
+
+    screen.fill((255, 255, 255))
+    screen.blit(sprite, (0, 0))
+    assert screen.get_at((0, 0))[:3] == (255, 255, 255)  # corner stays background
+    assert screen.get_at((10, 10))[:3] == (255, 0, 0)
+
+
+def test_load_image_converts(screen):
+    image = load_image(pygame.Surface((8, 8)), alpha=False)
+    assert image.get_bitsize() == screen.get_bitsize()
@@ -0,0 +1,64 @@
+# Run the program as pytest -sv .\test_simulation.py
+
+import numpy as np
+
+from Python_Codes.falling_balls.simulation import BallWorld, FIXED_DT
+
+
+def old_loop(frames, inputs, seed, spawn_interval):
+    # the list-based loop from square_bounce.py, same spawn positions
+    rng = np.random.default_rng(seed)
+    WIDTH, HEIGHT, player_width, player_height = 800, 600, 100, 20
+    player_x = WIDTH // 2 - player_width // 2
+    balls, score, lives = [], 0, 3
+
+    for frame in range(frames):
+        if inputs[frame] < 0 and player_x > 0:
+            player_x -= 5
+        if inputs[frame] > 0 and player_x < WIDTH - player_width:
+            player_x += 5
+        if frame % spawn_interval == 0:
+            balls.append([float(rng.integers(0, WIDTH - 20 + 1, 1)[0]), 0])
+
+        new_balls = []
+        for ball in balls:
+            ball[1] += 1.5
+            if ball[1] >= HEIGHT - player_height - 10 and player_x <= ball[0] <= player_x + player_width:
+                score += 1
+            elif ball[1] < HEIGHT:
+                new_balls.append(ball)
+            else:
+                lives -= 1
+        balls = new_balls
+
+    return score, lives, sorted(map(tuple, balls))
+
+
+def test_matches_old_game_loop():
+    frames = 3000
+    rng = np.random.default_rng(7)
+    inputs = np.repeat(rng.integers(-1, 2, frames // 50), 50)
+
+    world = BallWorld(spawn_interval=7, seed=1, capacity=4)
+    for frame in range(frames):
+        world.step(inputs[frame])
+
+    score, lives, balls = old_loop(frames, inputs, seed=1, spawn_interval=7)
+    assert (world.score, world.lives) == (score, lives)
+    assert sorted(map(tuple, world.balls.tolist())) == balls
+
+
+def test_swap_remove_keeps_survivors():
+    world = BallWorld()
+    world.spawn(np.arange(10) * 10, ys=np.arange(10))
+    dead = np.zeros(10, dtype=bool)
+    dead[[0, 3, 9]] = True
+    world.remove(dead)
+    assert world.n == 7
+    assert sorted(world.balls[:, 1].tolist()) == [1, 2, 4, 5, 6, 7, 8]
+
+
+def test_fixed_timestep_and_mass_spawn():
+    world = BallWorld(spawn_interval=1, spawn_count=500, lives=10**9, seed=0)
+    assert world.advance(FIXED_DT * 10.5) == 10
+    assert world.n + world.score + (10**9 - world.lives) == 5000
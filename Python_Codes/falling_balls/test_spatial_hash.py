@@ -0,0 +1,40 @@
+# Run the program as pytest -sv .\test_spatial_hash.py
+
+import numpy as np
+
+from Python_Codes.falling_balls.simulation import BallWorld
+from Python_Codes.falling_balls.spatial_hash import (
+    SpatialHash,
+    brute_touching_pairs,
+    touching_pairs,
+)
+
+
+def test_pairs_match_brute_force():
+    rng = np.random.default_rng(3)
+    for n in [0, 1, 2, 50, 2000]:
+        pos = rng.uniform(-30, 830, (n, 2)) * [1, 0.75]
+        grid = SpatialHash(20, 800, 600)
+        expected = brute_touching_pairs(pos, 10)
+        assert np.array_equal(touching_pairs(pos, 10, grid), expected)
+
+
+def test_every_candidate_pair_is_unique():
+    pos = np.random.default_rng(0).uniform(0, 100, (500, 2))
+    i, j = SpatialHash(20, 100, 100).build(pos).pairs()
+    assert np.all(i != j)
+    pairs = np.stack([np.minimum(i, j), np.maximum(i, j)], axis=1)
+    assert len(np.unique(pairs, axis=0)) == len(pairs)
+
+
+def test_query_rect_and_paddles():
+    world = BallWorld()
+    world.spawn([100, 105, 400, 700], ys=[575, 560, 575, 10])
+    paddles = [(50, 570, 100, 20), (380, 570, 100, 20), (650, 0, 10, 10)]
+    balls, owners = world.paddle_contacts(paddles)
+    assert sorted(zip(balls.tolist(), owners.tolist())) == [(0, 0), (1, 0), (2, 1)]
+
+    near = world.grid.query_rect(0, 540, 200, 600)
+    assert {0, 1} <= set(near.tolist()) and 3 not in near
+
+    assert world.touching_pairs().tolist() == [[0, 1]]
@@ -0,0 +1,40 @@
+# Run the benchmark as python -m Python_Codes.frequency_counter.bench_frequency_counter
+
+import time
+
+import numpy as np
+
+from Python_Codes.frequency_counter.frequency_counter import count_frequencies
+
+SIZES = [10**4, 10**6, 10**7]
+CARDINALITIES = [10, 10**4, 10**6]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run():
+    rng = np.random.default_rng(0)
+    print(f"{'Size':<12}{'Distinct':<12}{'counter':<12}{'numpy':<12}{'stream':<12}{'parallel':<12}")
+    print("-" * 72)
+
+    for size in SIZES:
+        for card in CARDINALITIES:
+            arr = rng.integers(0, card, size)
+            items = arr.tolist()
+            chunks = (arr[i : i + (1 << 18)] for i in range(0, size, 1 << 18))
+
+            times = [
+                timed(lambda: count_frequencies(items)),
+                timed(lambda: count_frequencies(arr, engine="numpy")),
+                timed(lambda: count_frequencies(chunks, engine="stream")),
+                timed(lambda: count_frequencies(arr, engine="parallel")),
+            ]
+            print(f"{size:<12}{card:<12}" + "".join(f"{t:<12.4f}" for t in times))
+
+
+if __name__ == "__main__":
+    run()
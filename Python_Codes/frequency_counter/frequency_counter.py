@@ -0,0 +1,146 @@
+import os
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+CHUNK_SIZE = 1 << 20  # items per chunk for the parallel engine
+
+
+# =========================================engines========================================================================
+
+def _count_counter(items):
+    return Counter(items)
+
+
+def _unique_counts(arr):
+    import numpy as np
+
+    # -> (values, counts) arrays
+    arr = np.asarray(arr).ravel()
+    if not arr.size:
+        return arr, np.zeros(0, dtype=np.int64)
+
+    # small integer ranges: one bincount pass, no sort needed
+    if arr.dtype.kind in "iub":
+        low, high = int(arr.min()), int(arr.max())
+        if high - low <= max(4 * arr.size, 1 << 16):
+            counts = np.bincount((arr - low).astype(np.intp), minlength=high - low + 1)
+            keys = np.flatnonzero(counts)
+            return keys + low, counts[keys]
+
+    return np.unique(arr, return_counts=True)
+
+
+def _merge_unique(parts):
+    import numpy as np
+
+    # fold many (values, counts) pairs into one without going through Python dicts
+    values = np.concatenate([v for v, _ in parts])
+    counts = np.concatenate([c for _, c in parts])
+    keys, inverse = np.unique(values, return_inverse=True)
+    return keys, np.bincount(inverse, weights=counts, minlength=len(keys)).astype(np.int64)
+
+
+def _to_counter(values, counts):
+    return Counter(dict(zip(values.tolist(), counts.tolist())))
+
+
+def _count_numpy(items):
+    return _to_counter(*_unique_counts(items))
+
+
+def _is_numeric(chunk):
+    return hasattr(chunk, "dtype") and chunk.dtype.kind in "iufb"
+
+
+def _count_stream(chunks, merge_every=16):
+    # iterable of chunks (lists, arrays, memmap slices, ...) that never
+    # have to be in memory together; memory stays O(distinct values)
+    total = Counter()
+    partials = []
+
+    for chunk in chunks:
+        if _is_numeric(chunk):
+            partials.append(_unique_counts(chunk))
+            if len(partials) >= merge_every:
+                partials = [_merge_unique(partials)]
+        else:
+            total.update(chunk)
+
+    if partials:
+        total.update(_to_counter(*_merge_unique(partials)))
+    return total
+
+
+def _split(items, chunk_size):
+    if hasattr(items, "__getitem__") and hasattr(items, "__len__"):
+        for i in range(0, len(items), chunk_size):
+            yield items[i : i + chunk_size]
+    else:
+        it = iter(items)
+        while True:
+            chunk = list(islice(it, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+def _partial(chunk):
+    # numeric chunks travel back as two small arrays instead of a big dict
+    if _is_numeric(chunk):
+        return _unique_counts(chunk)
+    return Counter(chunk)
+
+
+def _count_parallel(items, workers=None, chunk_size=CHUNK_SIZE, merge_every=16):
+    # map: count every chunk in a worker, reduce: merge the partial counts;
+    # at most 2 chunks per worker are pending, so a generator is never
+    # pulled into memory ahead of the workers
+    workers = workers or os.cpu_count() or 1
+    total = Counter()
+    partials = []
+
+    def reduce(partial):
+        nonlocal partials
+        if isinstance(partial, Counter):
+            total.update(partial)
+        else:
+            partials.append(partial)
+            if len(partials) >= merge_every:
+                partials = [_merge_unique(partials)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _split(items, chunk_size):
+            pending.append(pool.submit(_partial, chunk))
+            if len(pending) >= 2 * workers:
+                reduce(pending.popleft().result())
+        while pending:
+            reduce(pending.popleft().result())
+
+    if partials:
+        total.update(_to_counter(*_merge_unique(partials)))
+    return total
+
+
+ENGINES = {
+    "counter": _count_counter,
+    "numpy": _count_numpy,
+    "stream": _count_stream,
+    "parallel": _count_parallel,
+}
+
+
+def count_frequencies(items, engine="counter", **options):
+    # engine="stream" expects an iterable of chunks instead of single items;
+    # "parallel" takes workers= and chunk_size=
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine {engine!r}, choose from {sorted(ENGINES)}")
+    return ENGINES[engine](items, **options)
+
+
+if __name__ == "__main__":
+    nums = [1, 2, 2, 3, 3, 3]
+    for engine in ("counter", "numpy", "parallel"):
+        print(f"{engine:<10}", dict(count_frequencies(nums, engine=engine)))
+    print(f"{'stream':<10}", dict(count_frequencies([nums[:2], nums[2:]], engine="stream")))
@@ -0,0 +1,46 @@
+# Run the program as pytest -sv .\test_frequency_counter.py
+
+import numpy as np
+import pytest
+
+from Python_Codes.frequency_counter.frequency_counter import count_frequencies
+
+NUMS = [1, 2, 2, 3, 3, 3]
+EXPECTED = {1: 1, 2: 2, 3: 3}
+
+
+def test_all_engines_agree():
+    assert count_frequencies(NUMS) == EXPECTED
+    assert count_frequencies(NUMS, engine="numpy") == EXPECTED
+    assert count_frequencies([NUMS[:4], NUMS[4:]], engine="stream") == EXPECTED
+    assert count_frequencies(NUMS, engine="parallel", workers=2, chunk_size=2) == EXPECTED
+
+
+def test_numpy_engine_wide_and_negative_ranges():
+    arr = np.array([-5, -5, 7, 10**12, 10**12])
+    assert count_frequencies(arr, engine="numpy") == {-5: 2, 7: 1, 10**12: 2}
+    assert count_frequencies(np.array([0.5, 0.5, 2.0]), engine="numpy") == {0.5: 2, 2.0: 1}
+    assert count_frequencies([], engine="numpy") == {}
+
+
+def test_stream_mixes_arrays_and_lists():
+    chunks = [np.array([1, 1, 2]), ["a", "b"], np.array([2, 2])]
+    assert count_frequencies(chunks, engine="stream") == {1: 2, 2: 3, "a": 1, "b": 1}
+
+
+def test_parallel_with_generator_input():
+    items = (i % 7 for i in range(1000))
+    assert count_frequencies(items, engine="parallel", workers=2, chunk_size=64) == count_frequencies(
+        [i % 7 for i in range(1000)]
+    )
+
+
+def test_parallel_merges_numeric_partials():
+    arr = np.arange(5000) % 13
+    got = count_frequencies(arr, engine="parallel", workers=2, chunk_size=100, merge_every=3)
+    assert got == count_frequencies(arr.tolist())
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        count_frequencies(NUMS, engine="magic")
@@ -0,0 +1,175 @@
+# Run the harness as python -m Python_Codes.game_harness.harness --game square_bounce --frames 600
+
+import argparse
+import cProfile
+import os
+import time
+
+import numpy as np
+
+PHASES = ("update", "draw", "flip")
+FRAME_BUDGET = 1 / 60  # seconds: a frame slower than this drops below 60 fps
+
+
+def headless():
+    # SDL picks its drivers when pygame.init() runs, so this must come first
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+class FrameTimer:
+    # collects the time spent in each phase of every frame
+
+    def __init__(self):
+        self.samples = {phase: [] for phase in PHASES}
+        self.cpu = 0.0  # process CPU seconds for the whole run
+        self._last = None
+
+    def start(self):
+        self._last = time.perf_counter()
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.samples[phase].append(now - self._last)
+        self._last = now
+
+    def phase_times(self, phase):
+        return np.array(self.samples[phase])
+
+    def frame_times(self):
+        return sum(self.phase_times(phase) for phase in PHASES)
+
+    def report(self):
+        # milliseconds; "frame" is the sum of the three phases
+        rows = {phase: self.phase_times(phase) for phase in PHASES}
+        rows["frame"] = self.frame_times()
+        return {
+            name: {
+                "p50": float(np.percentile(times, 50)) * 1e3,
+                "p99": float(np.percentile(times, 99)) * 1e3,
+                "total": float(times.sum()) * 1e3,
+            }
+            for name, times in rows.items()
+            if len(times)
+        }
+
+
+def scripted_input(frames, seed=0, hold=30):
+    # random A/D presses held for `hold` frames, like a player sweeping around
+    rng = np.random.default_rng(seed)
+    return np.repeat(rng.integers(-1, 2, -(-frames // hold)), hold)[:frames].tolist()
+
+
+def populated_world(balls, seed=0, **options):
+    # a world that already holds `balls` balls spread over the top of the screen;
+    # lives are unlimited so the run never ends early
+    from Python_Codes.falling_balls.simulation import BallWorld
+
+    world = BallWorld(lives=10**9, capacity=max(balls, 1), seed=seed, **options)
+    rng = np.random.default_rng(seed)
+    world.spawn(
+        rng.integers(0, world.width - 2 * world.ball_radius + 1, balls),
+        rng.uniform(0, world.height * 0.75, balls),
+    )
+    return world
+
+
+def run_game(game="square_bounce", frames=300, balls=0, profile=None, seed=0, **options):
+    # runs one game under the dummy video driver and returns its FrameTimer;
+    # profile: path for a cProfile dump of the run
+    headless()
+    timer = FrameTimer()
+
+    if game == "square_bounce":
+        from Python_Codes.falling_balls.game import run
+
+        kwargs = dict(world=populated_world(balls, seed), inputs=scripted_input(frames, seed))
+    elif game == "image_inserter":
+        import pygame
+
+        from Python_Codes.image_inserter import run
+
+        image = pygame.Surface((256, 256), pygame.SRCALPHA)
+        image.fill((0, 160, 0, 255))
+        kwargs = dict(image=image)
+    else:
+        raise ValueError(f"unknown game {game!r}")
+    kwargs.update(options)
+
+    profiler = cProfile.Profile() if profile else None
+    if profiler:
+        profiler.enable()
+    cpu = time.process_time()
+    run(frames=frames, timer=timer, fps=0, **kwargs)
+    timer.cpu = time.process_time() - cpu
+    if profiler:
+        profiler.disable()
+        profiler.dump_stats(profile)
+
+    return timer
+
+
+def compare_dirty(game="square_bounce", frames=300, balls=0):
+    # the same scripted run with full redraws and with the dirty-rect renderer
+    full = run_game(game, frames, balls)
+    dirty = run_game(game, frames, balls, dirty=True)
+    saved = 1 - dirty.frame_times().sum() / full.frame_times().sum()
+    return full, dirty, saved
+
+
+def max_entities(frames=120, budget=FRAME_BUDGET, start=100, limit=10**6):
+    # doubles the ball count until the p99 frame time no longer fits the
+    # budget, then bisects between the last good and the first bad count
+    good, bad = 0, None
+    n = start
+    while n <= limit:
+        p99 = run_game(balls=n, frames=frames).report()["frame"]["p99"] / 1e3
+        if p99 > budget:
+            bad = n
+            break
+        good, n = n, n * 2
+
+    if bad is None:
+        return good
+    while bad - good > max(good // 10, 1):
+        mid = (good + bad) // 2
+        p99 = run_game(balls=mid, frames=frames).report()["frame"]["p99"] / 1e3
+        good, bad = (mid, bad) if p99 <= budget else (good, mid)
+    return good
+
+
+def print_report(report):
+    print(f"{'phase':<10}{'p50 ms':<12}{'p99 ms':<12}{'total ms':<12}")
+    print("-" * 46)
+    for name, row in report.items():
+        print(f"{name:<10}{row['p50']:<12.3f}{row['p99']:<12.3f}{row['total']:<12.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a game headlessly and report frame timings.")
+    parser.add_argument("--game", default="square_bounce", choices=["square_bounce", "image_inserter"])
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--balls", type=int, default=0, help="balls already on screen (square_bounce)")
+    parser.add_argument("--dirty", action="store_true", help="use the dirty-rect renderer")
+    parser.add_argument("--compare-dirty", action="store_true", help="report the time saved by the dirty-rect renderer")
+    parser.add_argument("--profile", help="write a cProfile dump of the run to this file")
+    parser.add_argument("--max-entities", action="store_true", help="find the largest ball count that holds 60 fps")
+    args = parser.parse_args(argv)
+
+    timer = run_game(args.game, args.frames, args.balls, args.profile, dirty=args.dirty)
+    print(f"{args.game}: {args.frames} frames, {timer.cpu * 1e3:.1f} ms CPU")
+    print_report(timer.report())
+    if args.profile:
+        print(f"profile written to {args.profile}")
+
+    if args.compare_dirty:
+        full, dirty, saved = compare_dirty(args.game, args.frames, args.balls)
+        print(f"full redraw: {full.cpu * 1e3:.1f} ms CPU, dirty rects: {dirty.cpu * 1e3:.1f} ms CPU")
+        print(f"frame time saved by dirty rects: {saved:.0%}")
+
+    if args.max_entities:
+        print(f"max sustainable balls at 60 fps (p99): {max_entities()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Run the program as pytest -sv .\test_harness.py
+
+import pstats
+
+import pygame
+
+from Python_Codes.game_harness.harness import (
+    FrameTimer,
+    PHASES,
+    compare_dirty,
+    headless,
+    run_game,
+    scripted_input,
+)
+
+
+def test_square_bounce_headless(tmp_path):
+    profile = tmp_path / "run.prof"
+    timer = run_game("square_bounce", frames=30, balls=200, profile=str(profile))
+
+    report = timer.report()
+    assert set(report) == set(PHASES) | {"frame"}
+    assert all(len(timer.samples[phase]) == 30 for phase in PHASES)
+    assert report["frame"]["p50"] <= report["frame"]["p99"]
+    assert pstats.Stats(str(profile)).total_calls > 0
+
+
+def test_image_inserter_headless():
+    timer = run_game("image_inserter", frames=10)
+    assert len(timer.frame_times()) == 10
+
+
+def test_dirty_static_image_presents_once():
+    from Python_Codes.image_inserter import run
+
+    headless()
+    image = pygame.Surface((16, 16))
+    assert run(image, frames=50) == 0
+    assert run(image, frames=50, dirty=True) == 49
+
+    full, dirty, _ = compare_dirty("image_inserter", frames=50)
+    assert len(full.frame_times()) == len(dirty.frame_times()) == 50
+
+
+def test_scripted_input_and_timer():
+    inputs = scripted_input(100, hold=10)
+    assert len(inputs) == 100 and set(inputs) <= {-1, 0, 1}
+    assert inputs[:10] == [inputs[0]] * 10
+
+    timer = FrameTimer()
+    timer.start()
+    for phase in PHASES:
+        timer.mark(phase)
+    assert timer.frame_times()[0] >= 0
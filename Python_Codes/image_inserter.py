@@ -1,34 +1,73 @@
 import pygame
 
-# Initialize pygame
-pygame.init()
-
 # Set display dimensions
 WIDTH, HEIGHT = 800, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Display Image in Pygame")
+BACKGROUND = (30, 30, 30)
+IMAGE_PATH = r"C:\Users\Naman Patel\Desktop\Python_Progs\zombie.png"  # Replace with your image file path
+
+
+def run(image=IMAGE_PATH, frames=None, timer=None, fps=0, dirty=False):
+    # image: a file path or an already loaded Surface
+    # frames, timer, fps: same meaning as in falling_balls.game.run()
+    # dirty: the picture is static, so draw and present it only when the
+    #        window needs repainting instead of on every frame
+    # returns the number of frames that were not presented
+    # Initialize pygame
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Display Image in Pygame")
+
+    # Load the image, converted once to the screen's pixel format so the
+    # blit below is a plain copy instead of a conversion every frame
+    if isinstance(image, str):
+        image = pygame.image.load(image)
+    image = image.convert_alpha()
+    image_rect = image.get_rect(center=(WIDTH // 2, HEIGHT // 2))  # Center the image
+
+    # Game loop
+    running = True
+    redraw = True
+    skipped = 0
+    clock = pygame.time.Clock()
+    frame = 0
+
+    while running and (frames is None or frame < frames):
+        if timer:
+            timer.start()
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                redraw = True
+        if timer:
+            timer.mark("update")
+
+        if redraw:
+            # Fill the screen with a color (optional)
+            screen.fill(BACKGROUND)
 
-# Load the image
-image = pygame.image.load(
-    r"C:\Users\Naman Patel\Desktop\Python_Progs\zombie.png"
-)  # Replace with your image file path
-image_rect = image.get_rect(center=(WIDTH // 2, HEIGHT // 2))  # Center the image
+            # Draw the image
+            screen.blit(image, image_rect)
+        if timer:
+            timer.mark("draw")
 
-# Game loop
-running = True
-while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
+        # Update the display
+        if redraw:
+            pygame.display.update()
+            redraw = not dirty
+        else:
+            skipped += 1
+        if timer:
+            timer.mark("flip")
 
-    # Fill the screen with a color (optional)
-    screen.fill((30, 30, 30))
+        clock.tick(fps)
+        frame += 1
 
-    # Draw the image
-    screen.blit(image, image_rect)
+    # Quit pygame
+    pygame.quit()
+    return skipped
 
-    # Update the display
-    pygame.display.update()
 
-# Quit pygame
-pygame.quit()
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,177 @@
+import heapq
+from bisect import bisect_left, bisect_right
+
+LOAD = 256  # target bucket size for IntervalSet
+
+# intervals are closed [start, end]; touching ones ([1, 3] and [3, 5]) merge,
+# the same rule as merge_intervals() in Find_Advanced_Bug.py
+
+
+# =========================================bulk merge=====================================================================
+
+def merge_intervals(intervals):
+    # vectorized: sort by start, then a running max of the ends tells where
+    # one merged block stops and the next one begins
+    import numpy as np
+
+    arr = np.asarray(intervals).reshape(-1, 2)
+    if not len(arr):
+        return []
+
+    arr = arr[np.lexsort((arr[:, 1], arr[:, 0]))]
+    starts, reach = arr[:, 0], np.maximum.accumulate(arr[:, 1])
+
+    new_block = np.empty(len(arr), dtype=bool)
+    new_block[0] = True
+    new_block[1:] = starts[1:] > reach[:-1]
+
+    first = np.flatnonzero(new_block)
+    last = np.append(first[1:] - 1, len(arr) - 1)
+    return np.column_stack((starts[first], reach[last])).tolist()
+
+
+# =========================================interval set===================================================================
+
+class IntervalSet:
+    # disjoint, sorted intervals kept in buckets of a few hundred entries
+    # (starts and ends in parallel lists) so add() only shifts one small list
+    # and every lookup is two bisects: O(log n) amortized per operation
+
+    def __init__(self, intervals=()):
+        merged = merge_intervals(list(intervals))
+        self._starts = [[s for s, _ in merged[i : i + LOAD]] for i in range(0, len(merged), LOAD)]
+        self._ends = [[e for _, e in merged[i : i + LOAD]] for i in range(0, len(merged), LOAD)]
+        self._last = [ends[-1] for ends in self._ends]  # biggest end in each bucket
+
+    def __len__(self):
+        return sum(map(len, self._starts))
+
+    def __iter__(self):
+        for starts, ends in zip(self._starts, self._ends):
+            yield from zip(starts, ends)
+
+    def __repr__(self):
+        return f"IntervalSet({[list(i) for i in self]})"
+
+    def add(self, start, end):
+        if start > end:
+            raise ValueError(f"start {start} is after end {end}")
+
+        start, end = self._pop_touching(start, end)
+        self._insert(start, end)
+
+    def _pop_touching(self, start, end):
+        # removes every stored interval touching [start, end], returns the union
+        b = bisect_left(self._last, start)
+
+        while b < len(self._starts):
+            starts, ends = self._starts[b], self._ends[b]
+            i = bisect_left(ends, start)
+            j = bisect_right(starts, end, i)
+            if i == j:
+                break
+
+            start = min(start, starts[i])
+            end = max(end, ends[j - 1])
+            whole_tail = j == len(starts)
+            del starts[i:j]
+            del ends[i:j]
+
+            if starts:
+                self._last[b] = ends[-1]
+                b += 1
+            else:
+                del self._starts[b], self._ends[b], self._last[b]
+
+            # the union can only reach into the next bucket if it ate this one's tail
+            if not whole_tail:
+                break
+
+        return start, end
+
+    def _insert(self, start, end):
+        if not self._starts:
+            self._starts.append([start])
+            self._ends.append([end])
+            self._last.append(end)
+            return
+
+        b = min(bisect_left(self._last, start), len(self._starts) - 1)
+        starts, ends = self._starts[b], self._ends[b]
+        i = bisect_left(starts, start)
+        starts.insert(i, start)
+        ends.insert(i, end)
+        self._last[b] = ends[-1]
+
+        if len(starts) > 2 * LOAD:
+            self._starts[b : b + 1] = [starts[:LOAD], starts[LOAD:]]
+            self._ends[b : b + 1] = [ends[:LOAD], ends[LOAD:]]
+            self._last[b : b + 1] = [ends[LOAD - 1], ends[-1]]
+
+    def overlaps(self, start, end=None):
+        # a single point or a closed range
+        return bool(self.overlapping(start, end))
+
+    def overlapping(self, start, end=None):
+        if end is None:
+            end = start
+
+        found = []
+        b = bisect_left(self._last, start)
+        while b < len(self._starts):
+            starts, ends = self._starts[b], self._ends[b]
+            i = bisect_left(ends, start)
+            j = bisect_right(starts, end, i)
+            found.extend(zip(starts[i:j], ends[i:j]))
+            if j < len(starts):
+                break
+            b += 1
+
+        return found
+
+
+# =========================================streaming======================================================================
+
+def merge_sorted(intervals):
+    # generator over intervals already sorted by start; O(1) memory
+    current = None
+
+    last_start = None
+
+    for start, end in intervals:
+        if last_start is not None and start < last_start:
+            raise ValueError("intervals are not sorted by start")
+        last_start = start
+
+        if current is None:
+            current = [start, end]
+        elif start <= current[1]:
+            current[1] = max(current[1], end)
+        else:
+            yield tuple(current)
+            current = [start, end]
+
+    if current is not None:
+        yield tuple(current)
+
+
+def read_intervals(path):
+    # one "start,end" pair per line
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                start, end = line.split(",")
+                yield int(start), int(end)
+
+
+def merge_sorted_files(paths, out_path):
+    # k-way merge of pre-sorted files into one merged file, never loading them
+    streams = [read_intervals(p) for p in paths]
+    count = 0
+
+    with open(out_path, "w") as out:
+        for start, end in merge_sorted(heapq.merge(*streams)):
+            out.write(f"{start},{end}\n")
+            count += 1
+
+    return count
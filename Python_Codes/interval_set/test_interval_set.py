@@ -0,0 +1,98 @@
+# Run the program as pytest -sv .\test_interval_set.py
+
+import random
+
+import pytest
+
+from Python_Codes.interval_set.interval_set import (
+    merge_intervals,
+    IntervalSet,
+    merge_sorted,
+    merge_sorted_files,
+)
+
+
+def naive_merge(intervals):
+    result = []
+    for start, end in sorted(intervals):
+        if result and start <= result[-1][1]:
+            result[-1][1] = max(result[-1][1], end)
+        else:
+            result.append([start, end])
+    return result
+
+
+def random_intervals(rng, n):
+    out = []
+    for _ in range(n):
+        start = rng.randint(1, 50)
+        out.append([start, rng.randint(start, start + 10)])
+    return out
+
+
+def test_contained_interval_does_not_shrink():
+    assert merge_intervals([[5, 19], [8, 16]]) == [[5, 19]]
+    assert merge_intervals([[1, 3], [3, 5], [7, 8]]) == [[1, 5], [7, 8]]
+    assert merge_intervals([]) == []
+
+
+def test_bulk_and_incremental_match_naive():
+    rng = random.Random(0)
+    for _ in range(200):
+        intervals = random_intervals(rng, rng.randint(1, 20))
+        expected = naive_merge(intervals)
+        assert merge_intervals(intervals) == expected
+
+        s = IntervalSet()
+        for start, end in intervals:
+            s.add(start, end)
+        assert [list(i) for i in s] == expected
+        assert [list(i) for i in IntervalSet(intervals)] == expected
+
+
+def test_many_buckets():
+    from Python_Codes.interval_set import interval_set
+
+    rng = random.Random(2)
+    intervals = [[s, s + rng.randint(0, 5)] for s in (rng.randint(0, 20000) for _ in range(3000))]
+    s = IntervalSet()
+    for start, end in intervals:
+        s.add(start, end)
+    assert len(s._starts) > 1
+    assert all(len(b) <= 2 * interval_set.LOAD for b in s._starts)
+    assert [list(i) for i in s] == naive_merge(intervals)
+
+    s.add(-1, 30000)  # swallows every bucket
+    assert list(s) == [(-1, 30000)]
+
+
+def test_overlap_queries():
+    s = IntervalSet([[1, 3], [10, 20]])
+    assert s.overlaps(3)
+    assert not s.overlaps(5)
+    assert s.overlaps(4, 10)
+    assert not s.overlaps(4, 9)
+    assert s.overlapping(0, 100) == [(1, 3), (10, 20)]
+    with pytest.raises(ValueError):
+        s.add(5, 1)
+
+
+def test_streaming_file_merge(tmp_path):
+    rng = random.Random(1)
+    everything = []
+    paths = []
+    for n in range(3):
+        intervals = sorted(random_intervals(rng, 50))
+        everything += intervals
+        path = tmp_path / f"part{n}.csv"
+        path.write_text("".join(f"{s},{e}\n" for s, e in intervals))
+        paths.append(path)
+
+    out = tmp_path / "merged.csv"
+    count = merge_sorted_files(paths, out)
+    lines = out.read_text().splitlines()
+    assert count == len(lines)
+    assert [list(map(int, line.split(","))) for line in lines] == naive_merge(everything)
+
+    with pytest.raises(ValueError):
+        list(merge_sorted([(5, 6), (1, 2)]))
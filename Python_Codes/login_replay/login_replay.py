@@ -0,0 +1,145 @@
+import csv
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby, islice
+
+from Python_Codes.Find_Advanced_Bug import USERNAME, ENCRYPTED_PASSWORD, decrypt
+
+MAX_ATTEMPTS = 3
+BATCH_SIZE = 10000  # scenarios per worker task
+
+
+# =========================================single scenario================================================================
+
+def run_scenario(attempts, username, password, max_attempts=MAX_ATTEMPTS):
+    # same rules as login_system_auto(), without the printing
+    failures = 0
+    tried = 0
+
+    for user, pwd in attempts:
+        if failures >= max_attempts:
+            break
+        tried += 1
+        if user == username and pwd == password:
+            return {"success": True, "attempts": tried, "locked_out": False}
+        failures += 1
+
+    return {"success": False, "attempts": tried, "locked_out": failures >= max_attempts}
+
+
+def _run_batch(args):
+    batch, username, password, max_attempts = args
+    return [run_scenario(attempts, username, password, max_attempts) for attempts in batch]
+
+
+# =========================================many scenarios=================================================================
+
+def _batches(scenarios, size):
+    it = iter(scenarios)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def replay(scenarios, workers=1, batch_size=BATCH_SIZE, max_attempts=MAX_ATTEMPTS):
+    # generator of per-scenario results, in input order
+    password = decrypt(ENCRYPTED_PASSWORD)  # decode the credential once
+    tasks = ((batch, USERNAME, password, max_attempts) for batch in _batches(scenarios, batch_size))
+
+    if workers <= 1:
+        for task in tasks:
+            yield from _run_batch(task)
+        return
+
+    # keep only a few batches in flight so huge inputs never sit in memory
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(_run_batch, task))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def summarize(results):
+    summary = {"scenarios": 0, "success": 0, "denied": 0, "locked_out": 0, "attempts": 0}
+
+    for r in results:
+        summary["scenarios"] += 1
+        summary["success" if r["success"] else "denied"] += 1
+        summary["locked_out"] += r["locked_out"]
+        summary["attempts"] += r["attempts"]
+
+    n = summary["scenarios"] or 1
+    summary["success_rate"] = summary["success"] / n
+    summary["lockout_rate"] = summary["locked_out"] / n
+    return summary
+
+
+# =========================================scenario files=================================================================
+
+def _csv_attempts(reader, path):
+    # skips blank lines, rejects rows that are not scenario,user,password
+    for row in reader:
+        if not row:
+            continue
+        if len(row) != 3:
+            raise ValueError(f"{path}, line {reader.line_num}: expected scenario,user,password, got {row!r}")
+        yield row
+
+
+def load_scenarios(path):
+    # .jsonl: one scenario per line, [["admin", "1234"], ...] or {"attempts": [...]}
+    # .csv:   scenario,user,password rows, attempts of a scenario on consecutive rows
+    if str(path).endswith(".csv"):
+        with open(path, newline="") as f:
+            for _, group in groupby(_csv_attempts(csv.reader(f), path), key=lambda row: row[0]):
+                yield [(user, pwd) for _, user, pwd in group]
+    else:
+        with open(path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                scenario = json.loads(line)
+                if isinstance(scenario, dict):
+                    scenario = scenario["attempts"]
+                yield [tuple(attempt) for attempt in scenario]
+
+
+def replay_file(path, out_path=None, workers=None):
+    workers = workers or os.cpu_count() or 1
+    results = replay(load_scenarios(path), workers=workers)
+
+    if out_path is None:
+        return summarize(results)
+
+    def write_through(results, out):
+        for r in results:
+            out.write(json.dumps(r) + "\n")
+            yield r
+
+    with open(out_path, "w") as out:
+        return summarize(write_through(results, out))
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from Python_Codes.Find_Advanced_Bug import test_cases
+
+    # python -m Python_Codes.login_replay.login_replay [scenarios.jsonl|.csv] [results.jsonl]
+    if len(sys.argv) > 1:
+        start = time.perf_counter()
+        print(replay_file(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None))
+        print(f"took {time.perf_counter() - start:.2f} s")
+    else:
+        scenarios = test_cases * 250000  # 1 million scenarios
+        start = time.perf_counter()
+        print(summarize(replay(scenarios, workers=os.cpu_count() or 1)))
+        print(f"{len(scenarios)} scenarios in {time.perf_counter() - start:.2f} s")
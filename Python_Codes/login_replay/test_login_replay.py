@@ -0,0 +1,68 @@
+# Run the program as pytest -sv .\test_login_replay.py
+
+import pytest
+
+from Python_Codes.Find_Advanced_Bug import test_cases
+from Python_Codes.login_replay.login_replay import (
+    run_scenario,
+    replay,
+    summarize,
+    replay_file,
+    load_scenarios,
+)
+
+EXPECTED = [
+    {"success": True, "attempts": 1, "locked_out": False},
+    {"success": True, "attempts": 2, "locked_out": False},
+    {"success": True, "attempts": 3, "locked_out": False},
+    {"success": False, "attempts": 3, "locked_out": True},
+]
+
+
+def test_same_outcomes_as_login_system_auto():
+    assert list(replay(test_cases)) == EXPECTED
+
+
+def test_lockout_stops_further_attempts():
+    attempts = [("a", "b")] * 3 + [("admin", "1234")]
+    assert run_scenario(attempts, "admin", "1234") == {
+        "success": False,
+        "attempts": 3,
+        "locked_out": True,
+    }
+
+
+def test_parallel_replay_keeps_order():
+    scenarios = test_cases * 50
+    assert list(replay(scenarios, workers=2, batch_size=7)) == EXPECTED * 50
+
+
+def test_summary():
+    summary = summarize(replay(test_cases * 10))
+    assert summary["scenarios"] == 40
+    assert summary["success"] == 30
+    assert summary["locked_out"] == 10
+    assert summary["lockout_rate"] == 0.25
+
+
+def test_scenario_files(tmp_path):
+    jsonl = tmp_path / "scenarios.jsonl"
+    jsonl.write_text('[["admin", "1234"]]\n{"attempts": [["a", "b"], ["c", "d"], ["e", "f"]]}\n')
+    assert replay_file(jsonl, workers=1)["locked_out"] == 1
+
+    csv_path = tmp_path / "scenarios.csv"
+    csv_path.write_text("1,admin,wrong\n1,admin,1234\n2,x,y\n")
+    out = tmp_path / "results.jsonl"
+    summary = replay_file(csv_path, out_path=out, workers=2)
+    assert summary["success"] == 1 and summary["denied"] == 1
+    assert len(out.read_text().splitlines()) == 2
+
+
+def test_csv_blank_and_malformed_rows(tmp_path):
+    csv_path = tmp_path / "scenarios.csv"
+    csv_path.write_text("1,admin,1234\n\n2,a,b\n")
+    assert list(load_scenarios(csv_path)) == [[("admin", "1234")], [("a", "b")]]
+
+    csv_path.write_text("1,admin,1234\n2,a\n")
+    with pytest.raises(ValueError, match="line 2"):
+        list(load_scenarios(csv_path))
@@ -0,0 +1,154 @@
+import numpy as np
+
+CACHE_LINE = 64  # bytes
+PAGE = 4096  # bytes
+MAX_ROWS = 20  # rows printed before switching to a sample
+
+
+# =========================================offsets========================================================================
+
+def element_offsets(arr, indices=None):
+    # byte offset of every element (or of the given flat C-order indices)
+    # from arr's first element, without a Python loop
+    if arr.ndim == 0:
+        return np.zeros(() if indices is None else len(indices), dtype=np.int64)
+    strides = np.array(arr.strides, dtype=np.int64)
+
+    if indices is None:
+        grids = np.indices(arr.shape, dtype=np.int64, sparse=True)
+        return sum(g * s for g, s in zip(grids, strides))
+
+    coords = np.stack(np.unravel_index(indices, arr.shape), axis=-1)
+    return coords.astype(np.int64) @ strides
+
+
+def sample_indices(arr, max_rows=MAX_ROWS):
+    # flat indices to show: everything if small, else head, tail and a spread
+    if max_rows < 2:
+        raise ValueError("max_rows must be at least 2 (first and last element)")
+    if arr.size <= max_rows:
+        return np.arange(arr.size)
+    edge = max(max_rows // 4, 1)
+    head = np.arange(edge)
+    tail = np.arange(arr.size - edge, arr.size)
+    middle = np.linspace(head[-1] + 1, tail[0] - 1, max_rows - 2 * edge).astype(np.int64)
+    return np.unique(np.concatenate((head, middle, tail)))
+
+
+# =========================================buffer ownership===============================================================
+
+def root_base(arr):
+    # follow .base until reaching the object that owns the memory
+    base = arr
+    while isinstance(base, np.ndarray) and base.base is not None:
+        base = base.base
+    return base
+
+
+def _span(arr):
+    # lowest and highest byte touched, relative to the first element
+    if not arr.size:
+        return 0, 0
+    low = sum(s * (n - 1) for s, n in zip(arr.strides, arr.shape) if s < 0)
+    high = sum(s * (n - 1) for s, n in zip(arr.strides, arr.shape) if s > 0)
+    return low, high + arr.itemsize
+
+
+# =========================================cache checks===================================================================
+
+def cache_warnings(arr):
+    warnings = []
+    if arr.ndim == 0 or arr.size <= 1:
+        return warnings
+
+    inner = arr.strides[-1]
+    if abs(inner) != arr.itemsize and arr.shape[-1] > 1:
+        if arr.flags.f_contiguous:
+            warnings.append("Fortran order: C-order loops over the last axis jump "
+                            f"{abs(inner)} bytes per step; iterate the first axis innermost")
+        else:
+            warnings.append(f"last axis stride is {inner} bytes, not the itemsize "
+                            f"{arr.itemsize}: elements are not adjacent")
+        if abs(inner) >= CACHE_LINE:
+            warnings.append(f"last axis stride >= {CACHE_LINE} bytes: every element "
+                            "touches a new cache line")
+
+    for axis, (s, n) in enumerate(zip(arr.strides, arr.shape)):
+        if n > 1 and s < 0:
+            warnings.append(f"axis {axis} has a negative stride ({s}): walks memory backwards")
+        if n > 1 and s and abs(s) % PAGE == 0:
+            warnings.append(f"axis {axis} stride {s} is a multiple of {PAGE}: rows alias the "
+                            "same cache sets and can evict each other")
+
+    low, high = _span(arr)
+    if arr.nbytes and (high - low) > 2 * arr.nbytes:
+        warnings.append(f"elements are spread over {high - low} bytes for {arr.nbytes} bytes "
+                        "of data: most of every fetched cache line is wasted")
+
+    return warnings
+
+
+# =========================================report=========================================================================
+
+def inspect_array(arr, max_rows=MAX_ROWS):
+    base = root_base(arr)
+    low, high = _span(arr)
+    indices = sample_indices(arr, max_rows)
+
+    return {
+        "shape": arr.shape,
+        "dtype": arr.dtype,
+        "itemsize": arr.itemsize,
+        "strides": arr.strides,
+        "address": arr.__array_interface__["data"][0],
+        "nbytes": arr.nbytes,
+        "span": high - low,
+        "c_contiguous": arr.flags.c_contiguous,
+        "f_contiguous": arr.flags.f_contiguous,
+        "is_view": arr.base is not None,
+        "owns_data": arr.flags.owndata,
+        "base": type(base).__name__,
+        "shares_base": arr.base is not None and isinstance(base, np.ndarray) and np.shares_memory(arr, base),
+        "memmap": getattr(arr, "filename", None) or getattr(base, "filename", None),
+        "sampled": len(indices) < arr.size,
+        "indices": indices,
+        "offsets": element_offsets(arr, indices),
+        "warnings": cache_warnings(arr),
+    }
+
+
+def print_layout(arr, max_rows=MAX_ROWS, title="NumPy Array"):
+    info = inspect_array(arr, max_rows)
+
+    print("=" * 90)
+    print(title)
+    print("=" * 90)
+
+    for key in ("address", "shape", "dtype", "itemsize", "strides", "nbytes", "span",
+                "c_contiguous", "f_contiguous", "is_view", "owns_data", "base", "shares_base", "memmap"):
+        print(f"{key.replace('_', ' ').title():<14}: {info[key]}")
+    print()
+
+    print("=" * 90)
+    print(f"{'Index':<24}{'Value':<16}{'Cell Address':<20}{'Offset(Bytes)':<15}")
+    print("=" * 90)
+
+    for n, (flat, offset) in enumerate(zip(info["indices"].tolist(), info["offsets"].tolist())):
+        index = np.unravel_index(flat, arr.shape)
+        value = arr[index]
+        if info["sampled"] and n and flat != info["indices"][n - 1] + 1:
+            print("...")
+        print(f"{str(tuple(map(int, index))):<24}{str(value):<16}{info['address'] + offset:<20}{offset:<15}")
+
+    print("=" * 90)
+    if info["sampled"]:
+        print(f"showing {len(info['indices'])} of {arr.size} elements")
+    for warning in info["warnings"]:
+        print("⚠️ ", warning)
+
+
+if __name__ == "__main__":
+    grid = np.arange(1, 10, dtype=np.int64).reshape(3, 3)
+    print_layout(grid, title="NumPy 2D Grid")
+    print_layout(grid.T, title="Transposed view")
+    print_layout(np.zeros((1000, 1024), dtype=np.float32)[:, ::16], title="Strided slice")
@@ -0,0 +1,66 @@
+# Run the program as pytest -sv .\test_memory_layout.py
+
+import numpy as np
+import pytest
+
+from Python_Codes.memory_layout.memory_layout import (
+    element_offsets,
+    inspect_array,
+    print_layout,
+    cache_warnings,
+    sample_indices,
+)
+
+
+def loop_offsets(arr):
+    # what array_memory_mapping() does, one element at a time
+    out = np.zeros(arr.shape, dtype=np.int64)
+    for index in np.ndindex(arr.shape):
+        out[index] = sum(i * s for i, s in zip(index, arr.strides))
+    return out
+
+
+def test_offsets_match_loop_for_views():
+    base = np.arange(4 * 5 * 6, dtype=np.int32).reshape(4, 5, 6)
+    for arr in (base, base.T, base[::2, 1:, ::-3], np.asfortranarray(base), base[1]):
+        assert (element_offsets(arr) == loop_offsets(arr)).all()
+        flat = np.arange(arr.size)
+        assert (element_offsets(arr, flat) == loop_offsets(arr).ravel()).all()
+
+
+def test_contiguity_and_views():
+    grid = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]], dtype=np.int64)
+    info = inspect_array(grid)
+    assert info["c_contiguous"] and not info["is_view"] and info["warnings"] == []
+
+    info = inspect_array(grid.T)
+    assert info["f_contiguous"] and info["is_view"] and info["shares_base"]
+    assert any("Fortran" in w for w in info["warnings"])
+
+
+def test_cache_warnings_for_bad_strides():
+    arr = np.zeros((64, 1024), dtype=np.float32)[:, ::16]
+    warnings = " ".join(cache_warnings(arr))
+    assert "cache line" in warnings and "4096" in warnings
+    assert any("negative" in w for w in cache_warnings(np.arange(10)[::-1]))
+
+
+def test_memmap_and_sampling(tmp_path, capsys):
+    mm = np.memmap(tmp_path / "big.dat", dtype=np.float64, mode="w+", shape=(1000, 1000))
+    info = inspect_array(mm[10:20], max_rows=10)
+    assert info["memmap"] is not None
+    assert info["sampled"] and len(info["indices"]) <= 10
+
+    print_layout(mm, max_rows=10)
+    out = capsys.readouterr().out
+    assert "showing" in out and len(out.splitlines()) < 60
+
+
+def test_small_max_rows():
+    arr = np.arange(10)
+    for max_rows in (2, 3, 4, 5):
+        indices = sample_indices(arr, max_rows).tolist()
+        assert indices[0] == 0 and indices[-1] == 9 and len(indices) <= max_rows
+    assert len(inspect_array(arr, max_rows=3)["indices"]) == 3
+    with pytest.raises(ValueError):
+        sample_indices(arr, 1)
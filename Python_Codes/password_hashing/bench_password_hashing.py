@@ -0,0 +1,37 @@
+# Run the benchmark as python -m Python_Codes.password_hashing.bench_password_hashing
+
+import os
+import time
+
+from Python_Codes.password_hashing.password_hashing import hash_password, PasswordVerifier
+
+ITERATIONS = 20_000
+CHECKS = 256
+
+
+def run(thread_counts=(1, 2, 4, 8, 16)):
+    stored = hash_password("1234", iterations=ITERATIONS)
+    pairs = [("1234", stored)] * CHECKS
+
+    print(f"pbkdf2_sha256, {ITERATIONS} iterations, {os.cpu_count()} CPUs")
+    print(f"{'Threads':<10}{'Seconds':<12}{'Verifications/s':<18}")
+    print("-" * 40)
+
+    for threads in thread_counts:
+        # cache_size=0 so every check pays the full KDF cost
+        verifier = PasswordVerifier(cache_size=0, workers=threads)
+        start = time.perf_counter()
+        verifier.verify_batch(pairs)
+        seconds = time.perf_counter() - start
+        print(f"{threads:<10}{seconds:<12.3f}{CHECKS / seconds:<18.1f}")
+
+    verifier = PasswordVerifier()
+    verifier.verify("1234", stored)
+    start = time.perf_counter()
+    verifier.verify_batch(pairs)
+    seconds = time.perf_counter() - start
+    print(f"{'cached':<10}{seconds:<12.3f}{CHECKS / seconds:<18.1f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,104 @@
+import base64
+import hashlib
+import hmac
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# 🔐 KDF settings (tune so one hash takes ~50-100 ms on the target machine)
+PBKDF2_ITERATIONS = 200_000
+SCRYPT_N, SCRYPT_R, SCRYPT_P = 2**14, 8, 1
+SALT_SIZE = 16
+CACHE_SIZE = 1024
+
+
+def _b64(raw):
+    return base64.b64encode(raw).decode()
+
+
+def _unb64(text):
+    return base64.b64decode(text.encode())
+
+
+def hash_password(password, algorithm="pbkdf2", salt=None, iterations=PBKDF2_ITERATIONS):
+    # stored form: "pbkdf2_sha256$iterations$salt$hash" or "scrypt$n$r$p$salt$hash"
+    salt = salt or os.urandom(SALT_SIZE)
+
+    if algorithm == "pbkdf2":
+        digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+        return f"pbkdf2_sha256${iterations}${_b64(salt)}${_b64(digest)}"
+
+    if algorithm == "scrypt":
+        digest = hashlib.scrypt(password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
+        return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${_b64(salt)}${_b64(digest)}"
+
+    raise ValueError(f"unknown algorithm {algorithm!r}")
+
+
+def _derive(password, stored):
+    name, *params = stored.split("$")
+
+    if name == "pbkdf2_sha256":
+        iterations, salt, digest = params
+        new = hashlib.pbkdf2_hmac("sha256", password.encode(), _unb64(salt), int(iterations))
+    elif name == "scrypt":
+        n, r, p, salt, digest = params
+        new = hashlib.scrypt(password.encode(), salt=_unb64(salt), n=int(n), r=int(r), p=int(p))
+    else:
+        raise ValueError(f"unknown hash format {name!r}")
+
+    return new, _unb64(digest)
+
+
+def verify_password(password, stored):
+    new, digest = _derive(password, stored)
+    return hmac.compare_digest(new, digest)
+
+
+class PasswordVerifier:
+    # verify_password plus a bounded LRU of recent successful checks, so a
+    # user logging in again does not pay the KDF cost a second time
+
+    def __init__(self, cache_size=CACHE_SIZE, workers=None):
+        self.cache_size = cache_size
+        self.workers = workers or os.cpu_count() or 1
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        # the cache never holds passwords, only a keyed MAC of (stored, password)
+        self._secret = os.urandom(32)
+
+    def _cache_key(self, password, stored):
+        return hmac.new(self._secret, f"{stored}\0{password}".encode(), "sha256").digest()
+
+    def verify(self, password, stored):
+        key = self._cache_key(password, stored)
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return True
+            self.misses += 1
+
+        # hashlib releases the GIL here, so threads really run in parallel
+        ok = verify_password(password, stored)
+
+        if ok:
+            with self._lock:
+                self._cache[key] = True
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return ok
+
+    def verify_batch(self, pairs):
+        # pairs: iterable of (password, stored); results come back in order
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(lambda pair: self.verify(*pair), pairs))
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
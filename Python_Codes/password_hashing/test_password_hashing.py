@@ -0,0 +1,49 @@
+# Run the program as pytest -sv .\test_password_hashing.py
+
+from Python_Codes.password_hashing.password_hashing import (
+    hash_password,
+    verify_password,
+    PasswordVerifier,
+)
+
+FAST = 1000  # keep the tests quick
+
+
+def test_pbkdf2_round_trip():
+    stored = hash_password("1234", iterations=FAST)
+    assert stored.startswith("pbkdf2_sha256$1000$")
+    assert verify_password("1234", stored)
+    assert not verify_password("wrong", stored)
+
+
+def test_scrypt_round_trip():
+    stored = hash_password("1234", algorithm="scrypt")
+    assert verify_password("1234", stored)
+    assert not verify_password("1235", stored)
+
+
+def test_salt_makes_hashes_unique():
+    assert hash_password("1234", iterations=FAST) != hash_password("1234", iterations=FAST)
+
+
+def test_batch_and_cache():
+    stored = hash_password("1234", iterations=FAST)
+    verifier = PasswordVerifier(cache_size=2, workers=4)
+
+    pairs = [("1234", stored), ("nope", stored)] * 3
+    assert verifier.verify_batch(pairs) == [True, False] * 3
+
+    verifier.hits = verifier.misses = 0
+    assert verifier.verify("1234", stored)
+    assert verifier.hits == 1
+
+    # failed attempts are never cached
+    assert not verifier.verify("nope", stored)
+    assert verifier.misses == 1
+
+
+def test_cache_is_bounded():
+    verifier = PasswordVerifier(cache_size=2)
+    for pwd in ("a", "b", "c"):
+        assert verifier.verify(pwd, hash_password(pwd, iterations=FAST))
+    assert len(verifier._cache) == 2
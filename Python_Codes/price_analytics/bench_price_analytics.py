@@ -0,0 +1,55 @@
+# Run the benchmark as python -m Python_Codes.price_analytics.bench_price_analytics [max_exponent]
+
+import sys
+import time
+
+import numpy as np
+
+from Python_Codes.price_analytics.price_analytics import (
+    max_profit_scan,
+    MaxProfitTracker,
+    max_profit_k,
+)
+
+CHUNK = 1 << 22
+
+
+def price_chunks(n, seed=0):
+    # random walk generated chunk by chunk so 10^8 ticks never sit in memory
+    rng = np.random.default_rng(seed)
+    level = 1000
+    for i in range(0, n, CHUNK):
+        steps = rng.integers(-3, 4, min(CHUNK, n - i))
+        chunk = level + np.cumsum(steps)
+        level = int(chunk[-1])
+        yield chunk
+
+
+def run(max_exponent=8):
+    print(f"{'Prices':<14}{'Method':<14}{'Seconds':<12}{'Result'}")
+    print("-" * 60)
+
+    for exponent in range(6, max_exponent + 1):
+        n = 10**exponent
+
+        tracker = MaxProfitTracker()
+        start = time.perf_counter()
+        for chunk in price_chunks(n):
+            tracker.update_many(chunk)
+        print(f"{n:<14}{'vectorized':<14}{time.perf_counter() - start:<12.3f}{tracker.result()}")
+
+        if exponent <= 7:
+            prices = np.concatenate(list(price_chunks(n)))
+
+            start = time.perf_counter()
+            result = max_profit_k(prices, 10)
+            print(f"{n:<14}{'k=10':<14}{time.perf_counter() - start:<12.3f}{result}")
+
+        if exponent == 6:
+            start = time.perf_counter()
+            result = max_profit_scan(prices.tolist())
+            print(f"{n:<14}{'python scan':<14}{time.perf_counter() - start:<12.3f}{result}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 8)
@@ -0,0 +1,146 @@
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+# =========================================single transaction=============================================================
+
+def max_profit_scan(prices):
+    # the loop from find_max_profit(), returns (buy, sell, profit)
+    min_price = prices[0]
+    best_buy = prices[0]
+    best_sell = prices[0]
+    max_profit = 0
+
+    for p in prices[1:]:
+        if p - min_price > max_profit:
+            max_profit = p - min_price
+            best_buy = min_price
+            best_sell = p
+        if p < min_price:
+            min_price = p
+
+    return best_buy, best_sell, max_profit
+
+
+def _signed(prices):
+    # differences of unsigned prices wrap around (3 - 5 == 4294967294 for
+    # uint32), so widen them to a signed type, or float for uint64
+    if prices.dtype.kind == "u":
+        import numpy as np
+
+        return prices.astype(np.int64 if prices.itemsize < 8 else np.float64)
+    return prices
+
+
+class MaxProfitTracker:
+    # online version of max_profit_scan: feed prices one at a time with
+    # update() or as NumPy chunks with update_many(); result() at any time
+
+    def __init__(self):
+        self.min_price = None
+        self.best_buy = None
+        self.best_sell = None
+        self.max_profit = 0
+
+    def update(self, price):
+        if self.min_price is None:
+            self.min_price = self.best_buy = self.best_sell = price
+            return
+
+        if price - self.min_price > self.max_profit:
+            self.max_profit = price - self.min_price
+            self.best_buy = self.min_price
+            self.best_sell = price
+        if price < self.min_price:
+            self.min_price = price
+
+    def update_many(self, prices):
+        import numpy as np
+
+        prices = _signed(np.asarray(prices))
+        if not prices.size:
+            return
+        if self.min_price is None:
+            self.update(prices[0].item())
+            prices = prices[1:]
+            if not prices.size:
+                return
+
+        # cheapest price seen *before* each tick, carried over from earlier chunks
+        before = np.minimum.accumulate(np.concatenate(([self.min_price], prices[:-1])))
+        profits = prices - before
+        i = int(np.argmax(profits))  # first maximum, same tie rule as the scan
+
+        if profits[i] > self.max_profit:
+            self.max_profit = profits[i].item()
+            self.best_buy = before[i].item()
+            self.best_sell = prices[i].item()
+        self.min_price = min(self.min_price, prices.min().item())
+
+    def result(self):
+        return self.best_buy, self.best_sell, self.max_profit
+
+
+def max_profit(prices, chunk_size=1 << 22):
+    # vectorized batch version, chunked so temporaries stay small
+    tracker = MaxProfitTracker()
+    for i in range(0, len(prices), chunk_size):
+        tracker.update_many(prices[i : i + chunk_size])
+    return tracker.result()
+
+
+# =========================================k transactions==================================================================
+
+def max_profit_k(prices, k):
+    # best total profit with at most k buy/sell pairs (no overlapping trades)
+    import numpy as np
+
+    prices = _signed(np.asarray(prices))
+    if k <= 0 or prices.size < 2:
+        return 0
+
+    # every maximal rising stretch is one (valley, peak) pair
+    up = np.diff(prices) > 0
+    if not up.any():
+        return 0
+    if 2 * k >= prices.size:
+        return np.diff(prices)[up].sum().item()
+
+    edges = np.diff(np.concatenate(([False], up, [False])).astype(np.int8))
+    valleys = prices[np.flatnonzero(edges == 1)].tolist()
+    peaks = prices[np.flatnonzero(edges == -1)].tolist()
+
+    # merge pairs with a stack so each trade can be split or joined optimally
+    stack = []
+    profits = []
+    for v, p in zip(valleys, peaks):
+        while stack and v < stack[-1][0]:
+            sv, sp = stack.pop()
+            profits.append(sp - sv)
+        while stack and p >= stack[-1][1]:
+            sv, sp = stack.pop()
+            profits.append(sp - v)
+            v = sv
+        stack.append((v, p))
+    profits.extend(p - v for v, p in stack)
+
+    return sum(heapq.nlargest(k, profits))
+
+
+# =========================================many symbols====================================================================
+
+def _symbol_job(args):
+    symbol, prices, k = args
+    if k is None:
+        return symbol, max_profit(prices)
+    return symbol, max_profit_k(prices, k)
+
+
+def max_profit_many(series, k=None, workers=None):
+    # series: {symbol: prices}; one symbol per task across a process pool
+    workers = workers or os.cpu_count() or 1
+    jobs = [(symbol, prices, k) for symbol, prices in series.items()]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(pool.map(_symbol_job, jobs))
@@ -0,0 +1,78 @@
+# Run the program as pytest -sv .\test_price_analytics.py
+
+import random
+
+import numpy as np
+
+from Python_Codes.price_analytics.price_analytics import (
+    max_profit_scan,
+    MaxProfitTracker,
+    max_profit,
+    max_profit_k,
+    max_profit_many,
+)
+
+
+def random_prices(n, seed):
+    rng = random.Random(seed)
+    return [rng.randint(1, 20) for _ in range(n)]
+
+
+def brute_force_k(prices, k):
+    # textbook O(n * k) dynamic programme
+    buy = [float("-inf")] * (k + 1)
+    sell = [0] * (k + 1)
+    for p in prices:
+        for j in range(1, k + 1):
+            buy[j] = max(buy[j], sell[j - 1] - p)
+            sell[j] = max(sell[j], buy[j] + p)
+    return sell[k]
+
+
+def test_vectorized_matches_scan():
+    for seed in range(200):
+        prices = random_prices(random.Random(seed).randint(1, 40), seed)
+        expected = max_profit_scan(prices)
+        assert max_profit(np.array(prices)) == expected
+        assert max_profit(np.array(prices), chunk_size=3) == expected
+
+
+def test_tracker_one_at_a_time():
+    prices = random_prices(500, 1)
+    tracker = MaxProfitTracker()
+    for p in prices:
+        tracker.update(p)
+    assert tracker.result() == max_profit_scan(prices)
+
+
+def test_no_profit():
+    assert max_profit(np.array([9, 7, 5])) == (9, 9, 0)
+    assert max_profit(np.array([4])) == (4, 4, 0)
+
+
+def test_k_transactions_match_brute_force():
+    for seed in range(200):
+        prices = random_prices(random.Random(seed).randint(0, 30), seed)
+        for k in (0, 1, 2, 3, 20):
+            assert max_profit_k(prices, k) == brute_force_k(prices, k)
+
+
+def test_unsigned_prices():
+    for dtype in (np.uint8, np.uint32, np.uint64):
+        p = np.array([5, 3, 4], dtype=dtype)
+        assert max_profit_k(p, 1) == 1
+        assert max_profit_k(p, 5) == 1
+        assert max_profit(p) == (3, 4, 1)
+        assert max_profit(p, chunk_size=1) == (3, 4, 1)
+
+    for seed in range(50):
+        prices = random_prices(30, seed)
+        for k in (1, 2, 20):
+            assert max_profit_k(np.array(prices, dtype=np.uint16), k) == brute_force_k(prices, k)
+
+
+def test_many_symbols():
+    series = {f"S{i}": np.array(random_prices(100, i)) for i in range(5)}
+    result = max_profit_many(series, workers=2)
+    assert result == {s: max_profit_scan(p.tolist()) for s, p in series.items()}
+    assert max_profit_many(series, k=2, workers=2)["S0"] == brute_force_k(series["S0"].tolist(), 2)
@@ -0,0 +1,183 @@
+import os
+import struct
+from bisect import bisect_right
+import threading
+import zlib
+
+from Python_Codes.serialization.serialization import PickleCodec
+
+# data file:  records of  length (8 bytes) | crc32 (4 bytes) | pickled payload
+# index file: path + ".idx", one 8-byte offset per record, written after the
+# record itself, so a record is only visible to readers once it is complete
+HEADER = struct.Struct("<QI")
+OFFSET = struct.Struct("<Q")
+CODEC = PickleCodec()
+READ_BYTES = 4 << 20  # data read per block when iterating
+INDEX_BATCH = 4096  # offsets read per index read when iterating
+
+
+def index_path(path):
+    return f"{path}.idx"
+
+
+def _read_at(f, size, offset):
+    # positioned read with seek()/read(), which works on every platform
+    # (os.pread() is Unix only); callers serialise access to f
+    f.seek(offset)
+    return f.read(size)
+
+
+def _record_at(f, offset, size):
+    # -> end offset of a complete, undamaged record at offset, else None
+    if offset + HEADER.size > size:
+        return None
+    length, crc = HEADER.unpack(_read_at(f, HEADER.size, offset))
+    end = offset + HEADER.size + length
+    if end > size or zlib.crc32(_read_at(f, length, offset + HEADER.size)) != crc:
+        return None
+    return end
+
+
+# =========================================writer=========================================================================
+
+class RecordLogWriter:
+    # the single writer; opening it repairs whatever a crash left behind
+
+    def __init__(self, path, sync=False):
+        self.path = path
+        self.sync = sync
+        self.data = open(path, "a+b")
+        self.index = open(index_path(path), "a+b")
+        self._recover()
+
+    def _recover(self):
+        size = os.fstat(self.data.fileno()).st_size
+        count = os.fstat(self.index.fileno()).st_size // OFFSET.size
+
+        # drop index entries whose record is missing or damaged
+        end = 0
+        while count:
+            offset = OFFSET.unpack(_read_at(self.index, OFFSET.size, (count - 1) * OFFSET.size))[0]
+            end = _record_at(self.data, offset, size)
+            if end is not None:
+                break
+            count -= 1
+            end = 0
+        self.index.truncate(count * OFFSET.size)
+
+        # index records that made it to disk before their index entry did
+        while True:
+            next_end = _record_at(self.data, end, size)
+            if next_end is None:
+                break
+            self.index.write(OFFSET.pack(end))
+            end = next_end
+            count += 1
+        self.index.flush()
+
+        # and cut off a half-written last record
+        self.data.truncate(end)
+        self.offset = end
+        self.count = count
+
+    def append(self, obj):
+        payload = CODEC.dumps(obj)
+        self.data.write(HEADER.pack(len(payload), zlib.crc32(payload)))
+        self.data.write(payload)
+        self.data.flush()
+        if self.sync:
+            os.fsync(self.data.fileno())
+
+        self.index.write(OFFSET.pack(self.offset))
+        self.index.flush()
+        if self.sync:
+            os.fsync(self.index.fileno())
+
+        self.offset += HEADER.size + len(payload)
+        self.count += 1
+        return self.count - 1
+
+    def close(self):
+        self.data.close()
+        self.index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# =========================================reader=========================================================================
+
+class RecordLogReader:
+    # any number of readers, also while the writer is appending; each reader
+    # has its own file objects, and a lock around every seek()+read() pair
+    # lets threads share one
+
+    def __init__(self, path):
+        self.path = path
+        self.data = open(path, "rb", buffering=0)
+        self.index = open(index_path(path), "rb", buffering=0)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return os.fstat(self.index.fileno()).st_size // OFFSET.size
+
+    def _read(self, f, size, offset):
+        with self._lock:
+            return _read_at(f, size, offset)
+
+    def _offsets(self, start, stop):
+        raw = self._read(self.index, (stop - start) * OFFSET.size, start * OFFSET.size)
+        return struct.unpack(f"<{len(raw) // OFFSET.size}Q", raw)
+
+    def get(self, i):
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(f"record {i} out of range ({n} records)")
+
+        (offset,) = self._offsets(i, i + 1)
+        with self._lock:
+            length, _ = HEADER.unpack(_read_at(self.data, HEADER.size, offset))
+            payload = _read_at(self.data, length, offset + HEADER.size)
+        return CODEC.loads(payload)
+
+    __getitem__ = get
+
+    def iter_range(self, start, stop, read_bytes=READ_BYTES):
+        # records are read in blocks of about read_bytes (at least one
+        # record each) and sliced up, so memory stays bounded on big logs
+        start, stop, _ = slice(start, stop).indices(len(self))
+
+        for batch in range(start, stop, INDEX_BATCH):
+            offsets = self._offsets(batch, min(batch + INDEX_BATCH, stop))
+            # records are back to back: each one ends where the next starts
+            last_length, _ = HEADER.unpack(self._read(self.data, HEADER.size, offsets[-1]))
+            ends = offsets[1:] + (offsets[-1] + HEADER.size + last_length,)
+
+            i = 0
+            while i < len(offsets):
+                j = max(bisect_right(ends, offsets[i] + read_bytes, i), i + 1)
+                block = memoryview(self._read(self.data, ends[j - 1] - offsets[i], offsets[i]))
+
+                for offset in offsets[i:j]:
+                    pos = offset - offsets[i]
+                    length, _ = HEADER.unpack_from(block, pos)
+                    yield CODEC.loads(block[pos + HEADER.size : pos + HEADER.size + length])
+                i = j
+
+    def __iter__(self):
+        return self.iter_range(0, len(self))
+
+    def close(self):
+        self.data.close()
+        self.index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
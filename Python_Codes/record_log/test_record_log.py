@@ -0,0 +1,85 @@
+# Run the program as pytest -sv .\test_record_log.py
+
+import os
+
+import numpy as np
+import pytest
+
+from Python_Codes.record_log.record_log import RecordLogWriter, RecordLogReader, index_path
+
+
+def fill(path, n):
+    with RecordLogWriter(path) as w:
+        for i in range(n):
+            assert w.append({"i": i, "arr": np.full(4, i)}) == i
+
+
+def test_random_access_and_ranges(tmp_path):
+    path = tmp_path / "log.rec"
+    fill(path, 50)
+
+    with RecordLogReader(path) as r:
+        assert len(r) == 50
+        assert r.get(17)["i"] == 17
+        assert r[-1]["i"] == 49
+        assert [x["i"] for x in r.iter_range(10, 15)] == [10, 11, 12, 13, 14]
+        assert (list(r)[3]["arr"] == 3).all()
+        with pytest.raises(IndexError):
+            r.get(50)
+
+
+def test_iteration_reads_bounded_blocks(tmp_path, monkeypatch):
+    import Python_Codes.record_log.record_log as record_log
+
+    path = tmp_path / "log.rec"
+    fill(path, 50)
+    monkeypatch.setattr(record_log, "INDEX_BATCH", 7)
+
+    with RecordLogReader(path) as r:
+        sizes = []
+        read = r._read
+        r._read = lambda f, size, offset: sizes.append(size) or read(f, size, offset)
+
+        largest = {}
+        for read_bytes in (1, 1000, 10**9):
+            sizes.clear()
+            assert [x["i"] for x in r.iter_range(3, 47, read_bytes=read_bytes)] == list(range(3, 47))
+            largest[read_bytes] = max(sizes)
+
+        record = largest[1]  # one record per read
+        assert record < 1000 <= largest[10**9] and largest[1000] <= 1000
+        assert [x["i"] for x in r] == list(range(50))
+
+
+def test_reader_sees_appends(tmp_path):
+    path = tmp_path / "log.rec"
+    with RecordLogWriter(path) as w:
+        w.append("first")
+        reader = RecordLogReader(path)
+        assert len(reader) == 1
+        w.append("second")
+        assert len(reader) == 2 and reader.get(1) == "second"
+        reader.close()
+
+
+def test_recovers_truncated_last_record(tmp_path):
+    path = tmp_path / "log.rec"
+    fill(path, 5)
+    os.truncate(path, os.path.getsize(path) - 3)
+
+    with RecordLogWriter(path) as w:
+        assert w.append("after crash") == 4
+    with RecordLogReader(path) as r:
+        assert [x if isinstance(x, str) else x["i"] for x in r] == [0, 1, 2, 3, "after crash"]
+
+
+def test_rebuilds_missing_index_entries(tmp_path):
+    path = tmp_path / "log.rec"
+    fill(path, 5)
+    # crash between writing a record and its index entry (plus half an entry)
+    idx = index_path(path)
+    os.truncate(idx, os.path.getsize(idx) - 12)
+
+    RecordLogWriter(path).close()
+    with RecordLogReader(path) as r:
+        assert len(r) == 5 and r.get(4)["i"] == 4
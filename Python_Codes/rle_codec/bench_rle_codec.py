@@ -0,0 +1,44 @@
+# Run the benchmark as python -m Python_Codes.rle_codec.bench_rle_codec
+
+import random
+import time
+
+from Python_Codes.rle_codec.rle_codec import encode, decode, encode_binary, decode_binary
+
+SIZE = 1 << 24  # 16 MB
+
+
+def make_data(size, mean_run):
+    rng = random.Random(42)
+    pieces, total = [], 0
+    while total < size:
+        n = max(1, int(rng.expovariate(1 / mean_run)))
+        pieces.append(rng.choice(b"abcdefgh").to_bytes(1, "big") * n)
+        total += n
+    return b"".join(pieces)[:size]
+
+
+def timed(fn, data):
+    start = time.perf_counter()
+    out = fn(data)
+    return out, time.perf_counter() - start
+
+
+def run():
+    mb = SIZE / (1 << 20)
+    print(f"{'Mean run':<10}{'Form':<8}{'Ratio':<10}{'Encode MB/s':<14}{'Decode MB/s':<14}")
+    print("-" * 56)
+
+    for mean_run in (2, 10, 100, 1000):
+        data = make_data(SIZE, mean_run)
+
+        for form, enc, dec in (("text", encode, decode), ("binary", encode_binary, decode_binary)):
+            packed, t_enc = timed(enc, data)
+            restored, t_dec = timed(dec, packed)
+            assert restored == data
+            ratio = len(data) / len(packed)
+            print(f"{mean_run:<10}{form:<8}{ratio:<10.2f}{mb / t_enc:<14.1f}{mb / t_dec:<14.1f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,211 @@
+import re
+from itertools import groupby
+
+NUMPY_MIN = 4096  # below this the pure Python run detector is faster
+
+_TEXT_RUN = re.compile(r"(\D)(\d+)", re.DOTALL)
+_BYTES_RUN = re.compile(rb"(\D)(\d+)", re.DOTALL)
+
+
+# =========================================run detection==================================================================
+
+def runs(data):
+    # (values, lengths); values are 1-char strings for str, ints for bytes
+    if len(data) >= NUMPY_MIN:
+        return _runs_numpy(data)
+    return _runs_python(data)
+
+
+def _runs_python(data):
+    values, lengths = [], []
+    for value, group in groupby(data):
+        values.append(value)
+        lengths.append(sum(1 for _ in group))
+    return values, lengths
+
+
+def _runs_numpy(data):
+    import numpy as np
+
+    if isinstance(data, str):
+        buf = np.frombuffer(data.encode("utf-32-le"), dtype=np.uint32)
+    else:
+        buf = np.frombuffer(data, dtype=np.uint8)
+    if not len(buf):
+        return [], []
+
+    # a run starts wherever the value changes
+    starts = np.concatenate(([0], np.flatnonzero(buf[1:] != buf[:-1]) + 1))
+    lengths = np.diff(np.append(starts, len(buf)))
+    values = buf[starts]
+
+    if isinstance(data, str):
+        values = [chr(v) for v in values.tolist()]
+    return values, lengths
+
+
+# =========================================text form (a3b2c1)=============================================================
+
+def _text_runs(values, lengths, is_str):
+    for v in values:
+        if (v.isdigit() if is_str else 48 <= v <= 57):
+            raise ValueError("text form cannot hold digits, use encode_binary()")
+
+    if is_str:
+        return "".join(f"{v}{n}" for v, n in zip(values, _as_list(lengths)))
+    return b"".join(b"%c%d" % (v, n) for v, n in zip(_as_list(values), _as_list(lengths)))
+
+
+def _as_list(seq):
+    return seq.tolist() if hasattr(seq, "tolist") else seq
+
+
+def encode(data):
+    # "aaabbc" -> "a3b2c1", b"aaabbc" -> b"a3b2c1"
+    return _text_runs(*runs(data), isinstance(data, str))
+
+
+def decode(encoded):
+    is_str = isinstance(encoded, str)
+    pattern = _TEXT_RUN if is_str else _BYTES_RUN
+
+    if pattern.sub("" if is_str else b"", encoded):
+        raise ValueError("not a valid RLE text string")
+
+    return encoded[:0].join(ch * int(n) for ch, n in pattern.findall(encoded))
+
+
+# =========================================binary form (byte + varint length)=============================================
+
+def _pack(values, lengths):
+    import numpy as np
+
+    if not len(values):
+        return b""
+    values = np.asarray(values, dtype=np.uint8)
+    lengths = np.asarray(lengths, dtype=np.uint64)
+
+    # LEB128 varint: 7 bits per byte, high bit set on all but the last byte
+    nbytes = np.ones(len(lengths), dtype=np.int64)
+    for shift in range(7, 64, 7):
+        nbytes += lengths >= np.uint64(1 << shift)
+
+    size = nbytes + 1
+    pos = np.cumsum(size) - size
+    out = np.empty(int(size.sum()), dtype=np.uint8)
+    out[pos] = values
+
+    for j in range(int(nbytes.max())):
+        mask = nbytes > j
+        low = (lengths[mask] >> np.uint64(7 * j)) & np.uint64(0x7F)
+        more = np.where(nbytes[mask] > j + 1, 0x80, 0).astype(np.uint64)
+        out[pos[mask] + 1 + j] = low | more
+
+    return out.tobytes()
+
+
+def _unpack(blob, final=True):
+    # -> (values, lengths, bytes consumed)
+    values, lengths = [], []
+    i, n = 0, len(blob)
+
+    while i < n:
+        start = i
+        value = blob[i]
+        i += 1
+        length = shift = 0
+
+        while True:
+            if i >= n:
+                if final:
+                    raise ValueError("truncated RLE data")
+                return values, lengths, start
+            b = blob[i]
+            i += 1
+            length |= (b & 0x7F) << shift
+            shift += 7
+            if b < 0x80:
+                break
+
+        values.append(value)
+        lengths.append(length)
+
+    return values, lengths, n
+
+
+def _expand(values, lengths):
+    import numpy as np
+
+    if not values:
+        return b""
+    return np.repeat(np.array(values, dtype=np.uint8), lengths).tobytes()
+
+
+def encode_binary(data):
+    if isinstance(data, str):
+        data = data.encode()
+    return _pack(*_runs_numpy(data))
+
+
+def decode_binary(blob):
+    values, lengths, _ = _unpack(blob)
+    return _expand(values, lengths)
+
+
+# =========================================streaming======================================================================
+
+def encode_stream(chunks, binary=True):
+    # 🔁 the last run of every chunk is held back in case the next chunk continues it
+    pending = None
+    is_str = False
+
+    def emit(values, lengths):
+        if binary:
+            return _pack(values, lengths)
+        return _text_runs(values, lengths, is_str)
+
+    for chunk in chunks:
+        if binary and isinstance(chunk, str):
+            chunk = chunk.encode()
+        if not len(chunk):
+            continue
+        is_str = isinstance(chunk, str)
+
+        values, lengths = runs(chunk)
+        values, lengths = list(_as_list(values)), list(_as_list(lengths))
+
+        if pending is not None:
+            if values[0] == pending[0]:
+                lengths[0] += pending[1]
+            else:
+                yield emit([pending[0]], [pending[1]])
+
+        pending = values[-1], lengths[-1]
+        if len(values) > 1:
+            yield emit(values[:-1], lengths[:-1])
+
+    if pending is not None:
+        yield emit([pending[0]], [pending[1]])
+
+
+def decode_stream(chunks, binary=True):
+    carry = None
+
+    for chunk in chunks:
+        carry = chunk if carry is None else carry + chunk
+
+        if binary:
+            values, lengths, used = _unpack(carry, final=False)
+            yield _expand(values, lengths)
+        else:
+            # the last run may still be missing digits, keep it for later
+            last = None
+            for last in (_TEXT_RUN if isinstance(carry, str) else _BYTES_RUN).finditer(carry):
+                pass
+            used = last.start() if last else 0
+            yield decode(carry[:used])
+
+        carry = carry[used:]
+
+    if carry:
+        yield decode_binary(carry) if binary else decode(carry)
@@ -0,0 +1,59 @@
+# Run the program as pytest -sv .\test_rle_codec.py
+
+import pytest
+
+from Python_Codes.rle_codec.rle_codec import (
+    encode,
+    decode,
+    encode_binary,
+    decode_binary,
+    encode_stream,
+    decode_stream,
+)
+
+
+def chunks_of(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def test_text_form():
+    assert encode("aaabbc") == "a3b2c1"
+    assert encode(b"aaabbc") == b"a3b2c1"
+    assert decode("a3b2c1") == "aaabbc"
+    assert decode(b"z12") == b"z" * 12
+    assert encode("") == "" and decode("") == ""
+
+
+def test_text_form_rejects_digits_and_garbage():
+    with pytest.raises(ValueError):
+        encode("a11")
+    with pytest.raises(ValueError):
+        decode("abc")
+
+
+def test_binary_round_trip():
+    data = b"\x00" * 5 + b"\xff" * 300 + bytes(range(256)) + b"9" * 20000
+    blob = encode_binary(data)
+    assert decode_binary(blob) == data
+    assert encode_binary(b"a" * 300) == b"a\xac\x02"  # 300 as varint
+    with pytest.raises(ValueError):
+        decode_binary(blob[:-1])
+
+
+def test_numpy_and_python_detectors_agree():
+    text = "aaab" * 2000 + "ccccé"
+    assert decode(encode(text)) == text
+    assert encode(text) == "".join(encode(piece) for piece in ["aaab"] * 2000) + "c4é1"
+
+
+def test_streams_split_runs_across_chunks():
+    data = b"aaaabbbbbbbcd" * 50 + b"e" * 1000
+    text = data.decode()
+    for size in (1, 3, 64):
+        blob = b"".join(encode_stream(chunks_of(data, size)))
+        assert blob == encode_binary(data)
+        assert b"".join(decode_stream(chunks_of(blob, size))) == data
+
+        encoded = "".join(encode_stream(chunks_of(text, size), binary=False))
+        assert encoded == encode(text)
+        assert "".join(decode_stream(chunks_of(encoded, size), binary=False)) == text
@@ -0,0 +1,47 @@
+# Run the benchmark as python -m Python_Codes.serialization.bench_serialization
+
+import time
+
+import numpy as np
+
+from Python_Codes.serialization.serialization import dumps, loads
+
+PAYLOADS = {
+    "small dict": {"name": "Alice", "age": 25, "languages": ["English", "Spanish"]},
+    "10k records": [{"id": i, "name": f"user{i}", "score": i * 0.5, "tags": ["a", "b"]} for i in range(10000)],
+    "ndarray 64MB": np.random.default_rng(0).random(8 << 20),
+}
+CODECS = ["pickle", "marshal", "json"]
+COMPRESSIONS = [None, "zlib", "lzma"]
+
+
+def best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run():
+    print(f"{'Payload':<14}{'Codec':<9}{'Compression':<13}{'Bytes':<12}{'Encode (s)':<12}{'Decode (s)':<12}")
+    print("-" * 72)
+
+    for label, obj in PAYLOADS.items():
+        is_array = isinstance(obj, np.ndarray)
+        repeat = 1 if is_array else 5
+
+        for codec in CODECS:
+            if is_array and codec != "pickle":
+                continue  # marshal/json cannot hold NumPy arrays
+            for compression in COMPRESSIONS:
+                if is_array and compression == "lzma":
+                    continue  # minutes on 64 MB of random floats
+                t_enc, blob = best_time(lambda: dumps(obj, codec, compression), repeat)
+                t_dec, _ = best_time(lambda: loads(blob, codec, compression), repeat)
+                print(f"{label:<14}{codec:<9}{str(compression):<13}{len(blob):<12}{t_enc:<12.5f}{t_dec:<12.5f}")
+
+
+if __name__ == "__main__":
+    run()
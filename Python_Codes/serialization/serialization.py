@@ -0,0 +1,268 @@
+import json
+from abc import ABC, abstractmethod
+import lzma
+import marshal
+import mmap
+import pickle
+import struct
+import zlib
+
+# record file: MAGIC, one "codec compression" text line, then a (possibly
+# compressed) stream of records, each an 8-byte little-endian length + payload
+MAGIC = b"PYRECS1\n"
+LENGTH = struct.Struct("<Q")
+READ_SIZE = 1 << 20
+
+
+# =========================================codecs=========================================================================
+
+class Codec(ABC):
+    # subclass and register_codec() to plug in another format; a codec
+    # missing dumps_parts() or loads() fails when it is instantiated
+    name = None
+
+    def dumps(self, obj):
+        return b"".join(self.dumps_parts(obj))
+
+    @abstractmethod
+    def dumps_parts(self, obj):
+        # list of bytes-like pieces; writers send them out without joining
+        ...
+
+    @abstractmethod
+    def loads(self, data):
+        ...
+
+
+class PickleCodec(Codec):
+    # protocol 5: large buffers (NumPy arrays, bytearrays, ...) travel out of
+    # band next to the pickle and are loaded back as views, not copies
+    name = "pickle"
+
+    def dumps_parts(self, obj):
+        buffers = []
+        body = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        raws = [b.raw() for b in buffers]
+        header = struct.pack(f"<{len(raws) + 2}Q", len(raws), len(body), *(r.nbytes for r in raws))
+        return [header, body, *raws]
+
+    def loads(self, data):
+        data = memoryview(data)
+        (count,) = struct.unpack_from("<Q", data)
+        sizes = struct.unpack_from(f"<{count + 1}Q", data, 8)
+        pos = 8 * (count + 2)
+
+        body = data[pos : pos + sizes[0]]
+        pos += sizes[0]
+        buffers = []
+        for size in sizes[1:]:
+            buffers.append(data[pos : pos + size])
+            pos += size
+
+        return pickle.loads(body, buffers=buffers)
+
+
+class MarshalCodec(Codec):
+    # fastest for plain Python values (no custom classes, no NumPy)
+    name = "marshal"
+
+    def dumps_parts(self, obj):
+        return [marshal.dumps(obj)]
+
+    def loads(self, data):
+        return marshal.loads(data)
+
+
+class JSONCodec(Codec):
+    name = "json"
+
+    def dumps_parts(self, obj):
+        return [json.dumps(obj, separators=(",", ":")).encode()]
+
+    def loads(self, data):
+        return json.loads(bytes(data))
+
+
+CODECS = {}
+
+
+def register_codec(codec):
+    CODECS[codec.name] = codec
+    return codec
+
+
+for _codec in (PickleCodec(), MarshalCodec(), JSONCodec()):
+    register_codec(_codec)
+
+
+def get_codec(codec):
+    if isinstance(codec, Codec):
+        return codec
+    if codec not in CODECS:
+        raise ValueError(f"unknown codec {codec!r}, choose from {sorted(CODECS)}")
+    return CODECS[codec]
+
+
+# =========================================compression====================================================================
+
+COMPRESSORS = {
+    "zlib": (lambda: zlib.compressobj(6), zlib.decompressobj),
+    "lzma": (lzma.LZMACompressor, lzma.LZMADecompressor),
+}
+
+
+def dumps(obj, codec="pickle", compression=None):
+    data = get_codec(codec).dumps(obj)
+    if compression:
+        make, _ = COMPRESSORS[compression]
+        c = make()
+        data = c.compress(data) + c.flush()
+    return data
+
+
+def loads(data, codec="pickle", compression=None):
+    if compression:
+        _, make = COMPRESSORS[compression]
+        data = make().decompress(data)
+    return get_codec(codec).loads(data)
+
+
+# =========================================record streams=================================================================
+
+def _read_header(f):
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError("not a record file")
+    codec, compression = f.readline().decode().split()
+    return codec, None if compression == "none" else compression
+
+
+class RecordWriter:
+    # appends objects to a record file; an existing file keeps its codec and
+    # compression (a new compressed member is started for every writer)
+
+    def __init__(self, path, codec="pickle", compression=None):
+        self.file = open(path, "a+b")
+        self.file.seek(0)
+
+        if self.file.read(1):
+            self.file.seek(0)
+            codec, compression = _read_header(self.file)
+            self.file.seek(0, 2)
+        else:
+            self.file.write(MAGIC + f"{get_codec(codec).name} {compression or 'none'}\n".encode())
+
+        self.codec = get_codec(codec)
+        self.compressor = COMPRESSORS[compression][0]() if compression else None
+
+    def write(self, obj):
+        parts = self.codec.dumps_parts(obj)
+        size = sum(memoryview(p).nbytes for p in parts)
+
+        for part in [LENGTH.pack(size), *parts]:
+            if self.compressor:
+                self.file.write(self.compressor.compress(part))
+            else:
+                self.file.write(part)
+
+    def close(self):
+        if self.compressor:
+            self.file.write(self.compressor.flush())
+            self.compressor = None
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _plain_payloads(f, start):
+    # uncompressed: map the file and hand out slices, no copies at all.
+    # Objects that keep pointing into the map (the read-only NumPy arrays
+    # PickleCodec loads from out-of-band buffers) keep it alive; otherwise
+    # it is closed as soon as iteration ends or is abandoned
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mm)
+    pos = start
+
+    try:
+        while pos + LENGTH.size <= len(view):
+            (size,) = LENGTH.unpack_from(view, pos)
+            pos += LENGTH.size
+            if pos + size > len(view):
+                raise ValueError("truncated record")
+            yield view[pos : pos + size]
+            pos += size
+
+        if pos != len(view):
+            raise ValueError("truncated record")
+    finally:
+        try:
+            view.release()
+            mm.close()
+        except BufferError:
+            pass  # still exported, freed together with the last record using it
+
+
+def _compressed_payloads(f, compression):
+    make = COMPRESSORS[compression][1]
+    d = make()
+    buf = bytearray()
+
+    def records():
+        # pull every complete record out of the buffer
+        pos = 0
+        while len(buf) - pos >= LENGTH.size:
+            (size,) = LENGTH.unpack_from(buf, pos)
+            if len(buf) - pos - LENGTH.size < size:
+                break
+            yield bytes(buf[pos + LENGTH.size : pos + LENGTH.size + size])
+            pos += LENGTH.size + size
+        del buf[:pos]
+
+    for chunk in iter(lambda: f.read(READ_SIZE), b""):
+        while chunk:
+            buf += d.decompress(chunk)
+            # appended files hold several compressed members back to back
+            chunk = d.unused_data if d.eof else b""
+            if d.eof:
+                d = make()
+        yield from records()
+
+    if buf:
+        raise ValueError("truncated record")
+
+
+def iter_records(path):
+    # lazily yields the objects in a record file, one at a time
+    with open(path, "rb") as f:
+        codec, compression = _read_header(f)
+        codec = get_codec(codec)
+
+        if compression:
+            payloads = _compressed_payloads(f, compression)
+        else:
+            payloads = _plain_payloads(f, f.tell())
+
+        try:
+            for payload in payloads:
+                obj = codec.loads(payload)
+                del payload
+                yield obj
+        finally:
+            payloads.close()
+
+
+def dump(obj, path, codec="pickle", compression=None):
+    # single object file: a record file holding exactly one record
+    with open(path, "wb"):
+        pass
+    with RecordWriter(path, codec, compression) as w:
+        w.write(obj)
+
+
+def load(path):
+    for obj in iter_records(path):
+        return obj
+    raise ValueError(f"{path} holds no records")
@@ -0,0 +1,114 @@
+# Run the program as pytest -sv .\test_serialization.py
+
+import numpy as np
+import pytest
+
+from Python_Codes.serialization.serialization import (
+    CODECS,
+    Codec,
+    register_codec,
+    dumps,
+    loads,
+    dump,
+    load,
+    RecordWriter,
+    iter_records,
+)
+
+DATA = {"name": "Alice", "age": 25, "languages": ["English", "Spanish"]}
+
+
+def test_every_codec_and_compression_round_trips():
+    for codec in ("pickle", "marshal", "json"):
+        for compression in (None, "zlib", "lzma"):
+            assert loads(dumps(DATA, codec, compression), codec, compression) == DATA
+
+
+def test_pickle5_loads_arrays_without_copying():
+    arr = np.arange(1000, dtype=np.float64)
+    blob = dumps({"arr": arr})
+    out = loads(blob)["arr"]
+    assert (out == arr).all()
+    # the array points straight into the serialized bytes
+    assert np.shares_memory(out, np.frombuffer(blob, dtype=np.uint8))
+
+
+def test_record_stream_append_and_lazy_read(tmp_path):
+    for compression in (None, "zlib", "lzma"):
+        path = tmp_path / f"records-{compression}.rec"
+        with RecordWriter(path, "pickle", compression) as w:
+            for i in range(3):
+                w.write({"i": i, "arr": np.full(10, i)})
+        # a second writer appends with the codec stored in the file
+        with RecordWriter(path, "json") as w:
+            w.write({"i": 3, "arr": np.full(10, 3)})
+
+        records = iter_records(path)
+        assert next(records)["i"] == 0
+        rest = list(records)
+        assert [r["i"] for r in rest] == [1, 2, 3]
+        assert (rest[-1]["arr"] == 3).all()
+
+
+def test_map_is_closed_after_iteration(tmp_path, monkeypatch):
+    import mmap
+
+    maps = []
+
+    class TrackedMap(mmap.mmap):
+        def __new__(cls, *args, **kwargs):
+            m = super().__new__(cls, *args, **kwargs)
+            maps.append(m)
+            return m
+
+    monkeypatch.setattr(mmap, "mmap", TrackedMap)
+    path = tmp_path / "m.rec"
+    with RecordWriter(path) as w:
+        for i in range(3):
+            w.write({"i": i})
+        w.write(np.arange(10))
+
+    records = iter_records(path)
+    next(records)
+    records.close()  # abandoned early
+    assert maps[-1].closed
+
+    *_, arr = iter_records(path)
+    assert not arr.flags.writeable  # still a view into the map
+    assert not maps[-1].closed
+    assert list(iter_records(path))[:3] == [{"i": 0}, {"i": 1}, {"i": 2}]
+
+
+def test_truncated_file_is_reported(tmp_path):
+    path = tmp_path / "t.rec"
+    with RecordWriter(path) as w:
+        w.write(DATA)
+    path.write_bytes(path.read_bytes()[:-3])
+    with pytest.raises(ValueError):
+        list(iter_records(path))
+
+
+def test_single_object_files_and_custom_codec(tmp_path):
+    class ReprCodec(Codec):
+        name = "repr"
+
+        def dumps_parts(self, obj):
+            return [repr(obj).encode()]
+
+        def loads(self, data):
+            return eval(bytes(data))
+
+    class HalfCodec(Codec):
+        def dumps_parts(self, obj):
+            return [b""]
+
+    with pytest.raises(TypeError):
+        HalfCodec()  # no loads()
+
+    register_codec(ReprCodec())
+    try:
+        path = tmp_path / "data.pk1"
+        dump(DATA, path, codec="repr", compression="zlib")
+        assert load(path) == DATA
+    finally:
+        del CODECS["repr"]
@@ -0,0 +1,50 @@
+# Run the benchmark as python -m Python_Codes.sliding_window.bench_sliding_window
+
+import time
+
+import numpy as np
+
+from Python_Codes.sliding_window.sliding_window import (
+    window_sums,
+    window_maxs,
+    window_sums_np,
+    window_maxs_np,
+)
+
+SIZES = [10**4, 10**5, 10**6]
+WINDOWS = [3, 100, 1000]
+
+
+def naive_sums(arr, k):
+    # the old sliding_window_sum() approach: slice and sum every window
+    return [sum(arr[i : i + k]) for i in range(len(arr) - k + 1)]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def run():
+    rng = np.random.default_rng(0)
+    names = ["naive sum", "sum", "sum np", "max deque", "max np"]
+    print(f"{'n':<10}{'k':<8}" + "".join(f"{name:<12}" for name in names))
+    print("-" * 78)
+
+    for n in SIZES:
+        arr = rng.integers(1, 10, n)
+        values = arr.tolist()
+        for k in WINDOWS:
+            times = [
+                timed(naive_sums, values, k) if n * k <= 10**8 else float("nan"),
+                timed(window_sums, values, k),
+                timed(window_sums_np, arr, k),
+                timed(window_maxs, values, k),
+                timed(window_maxs_np, arr, k),
+            ]
+            print(f"{n:<10}{k:<8}" + "".join(f"{t:<12.4f}" for t in times))
+
+
+if __name__ == "__main__":
+    run()
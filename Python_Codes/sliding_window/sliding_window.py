@@ -0,0 +1,128 @@
+from collections import deque
+
+
+def _check(k):
+    if k < 1:
+        raise ValueError(f"window size must be >= 1, got {k}")
+
+
+# =========================================O(n) pure Python================================================================
+
+def window_sums(arr, k):
+    # running sum: add the new value, drop the one leaving the window
+    _check(k)
+    if len(arr) < k:
+        return []
+
+    total = sum(arr[:k])
+    sums = [total]
+    for i in range(k, len(arr)):
+        total += arr[i] - arr[i - k]
+        sums.append(total)
+    return sums
+
+
+def window_means(arr, k):
+    return [s / k for s in window_sums(arr, k)]
+
+
+def _window_extreme(arr, k, better):
+    # monotonic deque of indices: the front is always the current min/max
+    _check(k)
+    out = []
+    q = deque()
+
+    for i, x in enumerate(arr):
+        while q and not better(arr[q[-1]], x):
+            q.pop()
+        q.append(i)
+        if q[0] <= i - k:
+            q.popleft()
+        if i >= k - 1:
+            out.append(arr[q[0]])
+
+    return out
+
+
+def window_mins(arr, k):
+    return _window_extreme(arr, k, lambda kept, new: kept < new)
+
+
+def window_maxs(arr, k):
+    return _window_extreme(arr, k, lambda kept, new: kept > new)
+
+
+# =========================================NumPy batch kernels=============================================================
+
+def window_sums_np(arr, k):
+    import numpy as np
+
+    _check(k)
+    arr = np.asarray(arr)
+    if len(arr) < k:
+        return arr[:0]
+
+    # sum of arr[i:i+k] = csum[i+k] - csum[i]
+    # the leading zero takes the cumsum's dtype: a plain [0] is int64 and
+    # would turn an unsigned cumsum into float64
+    csum = np.cumsum(arr)
+    csum = np.concatenate((np.zeros(1, csum.dtype), csum))
+    return csum[k:] - csum[:-k]
+
+
+def window_means_np(arr, k):
+    return window_sums_np(arr, k) / k
+
+
+def window_mins_np(arr, k):
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    _check(k)
+    arr = np.asarray(arr)
+    if len(arr) < k:
+        return arr[:0]
+    return sliding_window_view(arr, k).min(axis=1)
+
+
+def window_maxs_np(arr, k):
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    _check(k)
+    arr = np.asarray(arr)
+    if len(arr) < k:
+        return arr[:0]
+    return sliding_window_view(arr, k).max(axis=1)
+
+
+# =========================================streaming=======================================================================
+
+def stream_windows(values, k):
+    # 🔁 generator over an unbounded stream: yields
+    # {"sum", "mean", "min", "max"} as soon as each full window is in
+    _check(k)
+    window = deque()
+    mins = deque()  # (index, value) pairs, values increasing
+    maxs = deque()  # (index, value) pairs, values decreasing
+    total = 0
+
+    for i, x in enumerate(values):
+        window.append(x)
+        total += x
+        if len(window) > k:
+            total -= window.popleft()
+
+        while mins and mins[-1][1] >= x:
+            mins.pop()
+        mins.append((i, x))
+        while maxs and maxs[-1][1] <= x:
+            maxs.pop()
+        maxs.append((i, x))
+        if mins[0][0] <= i - k:
+            mins.popleft()
+        if maxs[0][0] <= i - k:
+            maxs.popleft()
+
+        if len(window) == k:
+            yield {"sum": total, "mean": total / k, "min": mins[0][1], "max": maxs[0][1]}
@@ -0,0 +1,61 @@
+# Run the program as pytest -sv .\test_sliding_window.py
+
+import random
+
+import numpy as np
+import pytest
+
+from Python_Codes.sliding_window.sliding_window import (
+    window_sums,
+    window_means,
+    window_mins,
+    window_maxs,
+    window_sums_np,
+    window_means_np,
+    window_mins_np,
+    window_maxs_np,
+    stream_windows,
+)
+
+
+def naive(arr, k, fn):
+    return [fn(arr[i : i + k]) for i in range(len(arr) - k + 1)]
+
+
+def test_all_kernels_match_naive():
+    rng = random.Random(0)
+    for _ in range(100):
+        arr = [rng.randint(1, 10) for _ in range(rng.randint(0, 30))]
+        for k in (1, 2, 3, 7):
+            assert window_sums(arr, k) == naive(arr, k, sum)
+            assert window_means(arr, k) == naive(arr, k, lambda w: sum(w) / k)
+            assert window_mins(arr, k) == naive(arr, k, min)
+            assert window_maxs(arr, k) == naive(arr, k, max)
+            assert window_sums_np(arr, k).tolist() == naive(arr, k, sum)
+            assert np.allclose(window_means_np(arr, k), naive(arr, k, lambda w: sum(w) / k))
+            assert window_mins_np(arr, k).tolist() == naive(arr, k, min)
+            assert window_maxs_np(arr, k).tolist() == naive(arr, k, max)
+
+
+def test_stream_matches_batch():
+    rng = random.Random(1)
+    arr = [rng.randint(-50, 50) for _ in range(500)]
+    k = 5
+    out = list(stream_windows(iter(arr), k))
+    assert [w["sum"] for w in out] == window_sums(arr, k)
+    assert [w["min"] for w in out] == window_mins(arr, k)
+    assert [w["max"] for w in out] == window_maxs(arr, k)
+
+
+def test_unsigned_sums_stay_integers():
+    out = window_sums_np(np.array([1, 2, 3], dtype=np.uint8), 2)
+    assert out.dtype.kind == "u" and out.tolist() == [3, 5]
+
+    big = np.array([2**62, 1, 2**62], dtype=np.uint64)
+    assert window_sums_np(big, 1).tolist() == [2**62, 1, 2**62]
+    assert window_sums_np(big, 2).tolist() == [2**62 + 1, 2**62 + 1]
+
+
+def test_bad_window():
+    with pytest.raises(ValueError):
+        window_sums([1, 2], 0)
@@ -0,0 +1,92 @@
+# Run the benchmark as python -m Python_Codes.word_counter.bench_word_counter [sizes...]
+# e.g.  python -m Python_Codes.word_counter.bench_word_counter 1K 1M 1G
+
+import sys
+import time
+
+from Python_Codes.word_counter.word_counter import count_words, count_words_batch
+
+UNITS = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+SIZES = ["1K", "1M", "1G"]
+ENGINES = ["loop", "split", "numpy"]
+LOOP_LIMIT = 64 << 20  # the loop engine decodes to str and walks it in Python
+
+
+def parse_size(text):
+    text = text.upper()
+    if text[-1] in UNITS:
+        return int(text[:-1]) * UNITS[text[-1]]
+    return int(text)
+
+
+def make_text(size):
+    # short words with the odd double space, like real prose
+    pattern = b"the quick  brown fox jumps over   the lazy dog "
+    return (pattern * (size // len(pattern) + 1))[:size]
+
+
+def best_time(fn, data, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(data)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(sizes):
+    print(f"{'Size':<8}{'Engine':<10}{'Words':<14}{'Seconds':<14}{'MB/s':<10}")
+    print("-" * 56)
+
+    for label in sizes:
+        size = parse_size(label)
+        data = make_text(size)
+        # tiny inputs are too quick to time once
+        repeat = 200 if size <= UNITS["K"] else 3 if size <= UNITS["M"] * 64 else 1
+
+        for engine in ENGINES:
+            if engine == "loop" and size > LOOP_LIMIT:
+                print(f"{label:<8}{engine:<10}{'skipped (input too large)'}")
+                continue
+            if engine == "loop":
+                text = data.decode()
+                fn = count_words
+            else:
+                text = data
+                fn = lambda d, e=engine: count_words(d, engine=e)
+
+            seconds, words = best_time(fn, text, repeat)
+            mbps = size / seconds / UNITS["M"]
+            print(f"{label:<8}{engine:<10}{words:<14}{seconds:<14.6f}{mbps:<10.1f}")
+
+        print("-" * 56)
+
+
+def run_unicode(size=UNITS["M"]):
+    # isspace() semantics against today's ASCII-space loop on the same text
+    text = make_text(size).decode().replace("fox ", "fox\t").replace("dog ", "dog\n")
+
+    seconds, words = best_time(count_words, text, 3)
+    print(f"{'ascii loop':<16}{words:<14}{seconds:<14.6f}")
+    for engine in ENGINES:
+        fn = lambda d, e=engine: count_words(d, engine=e, unicode_spaces=True)
+        seconds, words = best_time(fn, text, 3)
+        print(f"{'unicode ' + engine:<16}{words:<14}{seconds:<14.6f}")
+
+
+def run_batch(n=100000):
+    # many short strings: per-call overhead against one batch call
+    sentences = [make_text(20 + i % 60).decode() for i in range(n)]
+
+    seconds, _ = best_time(lambda s: [count_words(t) for t in s], sentences, 3)
+    print(f"{n} x count_words()      : {seconds:.4f} s")
+    seconds, _ = best_time(count_words_batch, sentences, 3)
+    print(f"count_words_batch({n}) : {seconds:.4f} s")
+
+
+if __name__ == "__main__":
+    run(sys.argv[1:] or SIZES)
+    print()
+    run_unicode()
+    print()
+    run_batch()
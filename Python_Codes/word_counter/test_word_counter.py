@@ -1,6 +1,13 @@
 # Run the program as pytest -sv .\test_word_counter.py
 
-from Python_Codes.word_counter.word_counter import count_words
+from Python_Codes.word_counter.word_counter import (
+    count_words,
+    count_words_stream,
+    count_words_file,
+    count_words_batch,
+    corpus_stats,
+    MisraGries,
+)
 
 def test_basic():
     assert count_words("hello world") == 2
@@ -31,4 +38,115 @@ def test_single_word():
 
 
 def test_multiple_words():
-    assert count_words("python is very easy") == 4
\ No newline at end of file
+    assert count_words("python is very easy") == 4
+
+
+# 🔁 Same cases through the streaming / file path
+
+CASES = [
+    "hello world",
+    "   hello world",
+    "hello   world",
+    "hello world   ",
+    "",
+    "     ",
+    "python",
+    "python is very easy",
+    "  multiple   spaces   here ",
+    "héllo wörld ünïcode",
+]
+
+
+def chunks_of(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_stream_matches_count_words():
+    for text in CASES:
+        for size in (1, 2, 3, 7):
+            assert count_words_stream(chunks_of(text, size)) == count_words(text)
+            assert count_words_stream(chunks_of(text.encode(), size)) == count_words(text)
+
+
+def test_file_matches_count_words(tmp_path):
+    path = tmp_path / "words.txt"
+    for text in CASES:
+        path.write_text(text * 5, encoding="utf-8")
+        expected = count_words(text * 5)
+        assert count_words_file(path, chunk_size=4) == expected
+        assert count_words_file(path, chunk_size=4, workers=3) == expected
+
+
+def test_engines_match_loop():
+    for text in CASES:
+        for engine in ("split", "numpy"):
+            assert count_words(text, engine=engine) == count_words(text)
+            assert count_words(text.encode(), engine=engine) == count_words(text)
+            assert count_words(memoryview(text.encode()), engine=engine) == count_words(text)
+
+
+def test_numpy_engine_across_blocks():
+    from Python_Codes.word_counter.word_counter import _count_numpy
+
+    for text in CASES:
+        assert _count_numpy(text.encode(), block=2) == count_words(text)
+
+
+def test_split_engine_across_blocks():
+    from Python_Codes.word_counter.word_counter import _count_split
+
+    for text in CASES:
+        for data in (text, text.encode(), memoryview(text.encode())):
+            assert _count_split(data, block=2) == count_words(text)
+
+
+def test_batch_matches_count_words():
+    assert list(count_words_batch(CASES)) == [count_words(t) for t in CASES]
+    assert list(count_words_batch([""])) == [0]
+    assert len(count_words_batch([])) == 0
+
+
+def test_corpus_stats():
+    text = "the cat\nthe  dog\n\nthe cat sat"
+    for size in (1, 4, len(text)):
+        stats = corpus_stats(chunks_of(text, size), top_k=2)
+        assert stats["words"] == 7
+        assert stats["lines"] == 4
+        assert stats["bytes"] == len(text)
+        assert stats["top"] == [("the", 3), ("cat", 2)]
+
+
+def test_corpus_stats_without_newlines():
+    text = "alpha " * 20000 + "x" * 5000 + " beta"
+    for size in (1, 7, 4096):
+        stats = corpus_stats(chunks_of(text, size), top_k=3)
+        assert stats["words"] == 20002
+        assert stats["lines"] == 1
+        assert stats["top"][0] == ("alpha", 20000)
+    assert corpus_stats([]) == {"words": 0, "lines": 0, "bytes": 0, "top": []}
+
+
+def test_misra_gries_stays_bounded():
+    heavy = MisraGries(capacity=5)
+    for i in range(1000):
+        heavy.update({"hot": 3, f"cold{i}": 1})
+    assert len(heavy.counters) <= 10
+    assert heavy.top(1)[0][0] == "hot"
+
+
+UNICODE_CASES = {
+    "hello\tworld": 2,
+    "line one\nline two\r\n": 4,
+    "no\u00a0break\u3000ideographic\u2009thin": 4,
+    "\x1c\x1d\x1e\x1f\x85": 0,
+    "  tabs\t\tand   spaces ": 3,
+}
+
+
+def test_unicode_spaces_match_str_split():
+    for text, expected in UNICODE_CASES.items():
+        assert len(text.split()) == expected
+        for engine in ("loop", "split", "numpy"):
+            assert count_words(text, engine=engine, unicode_spaces=True) == expected
+            assert count_words(text.encode(), engine=engine, unicode_spaces=True) == expected
+    assert list(count_words_batch(list(UNICODE_CASES), unicode_spaces=True)) == list(UNICODE_CASES.values())
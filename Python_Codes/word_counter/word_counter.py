@@ -1,6 +1,27 @@
-def count_words(sentence):
+import heapq
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+CHUNK_SIZE = 1 << 20  # 1 MB per read
+NUMPY_BLOCK = 1 << 24  # 16 MB per vectorized block
+SPLIT_BLOCK = 1 << 20  # 1 MB per split(), which makes one object per word
+
+# every character for which str.isspace() is True (all of them live in the BMP)
+UNICODE_SPACES = frozenset(chr(c) for c in range(0x10000) if chr(c).isspace())
+
+
+def count_words(sentence, engine="loop", unicode_spaces=False):
+    engines = UNICODE_ENGINES if unicode_spaces else ENGINES
+    if engine not in engines:
+        raise ValueError(f"unknown engine {engine!r}, choose from {sorted(engines)}")
+    if engines[engine] is not count_words:
+        return engines[engine](sentence)
+
+    sentence = _as_text(sentence)
+
     count = 0
-    in_word = False 
+    in_word = False
 
     for ch in sentence:
         if ch != " " and not in_word:
@@ -12,21 +33,292 @@ def count_words(sentence):
     return count
 
 
-# 🔍 Test cases
-test_cases = [
-    "hello world",
-    "   hello world",
-    "hello   world",
-    "   hello   world  ",
-    "",
-    "one",
-    "   ",
-    "python is fun",
-    "  multiple   spaces   here "
-]
-
-# Run tests
-for t in test_cases:
-    print(f"Input: '{t}'")
-    print("Word count:", count_words(t))
-    print("-" * 30)
\ No newline at end of file
+# =========================================bulk engines=====================================================================
+
+def _is_bytes(data):
+    return isinstance(data, (bytes, bytearray, memoryview))
+
+
+def _count_split(data, block=SPLIT_BLOCK):
+    # every non-empty piece between single spaces is one word
+    if len(data) > block:
+        # bounded blocks keep the list of pieces small on GB-sized inputs
+        return _merge_parts(_count_chunk(data[i : i + block]) for i in range(0, len(data), block))
+
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    space = b" " if _is_bytes(data) else " "
+    parts = data.split(space)
+    return len(parts) - parts.count(data[:0])
+
+
+def _count_numpy(data, block=NUMPY_BLOCK):
+    import numpy as np
+
+    # a word starts wherever a non-space byte follows a space (or the start)
+    if isinstance(data, str):
+        data = data.encode()
+    buf = np.frombuffer(data, dtype=np.uint8)
+
+    count = 0
+    prev = False  # was the byte before this block inside a word?
+
+    # blocks keep the temporary boolean arrays small on GB-sized inputs
+    for i in range(0, len(buf), block):
+        word = buf[i : i + block] != 32
+        count += int(np.count_nonzero(word[1:] & ~word[:-1]))
+        if word[0] and not prev:
+            count += 1
+        prev = bool(word[-1])
+
+    return count
+
+
+def _as_text(data):
+    if _is_bytes(data):
+        return bytes(data).decode()
+    return data
+
+
+def _count_unicode_loop(sentence, spaces=UNICODE_SPACES):
+    count = 0
+    in_word = False
+
+    # one set lookup per character; this is what keeps it as fast as the
+    # two string comparisons of the ASCII loop
+    for ch in _as_text(sentence):
+        if ch in spaces:
+            in_word = False
+        elif not in_word:
+            count += 1
+            in_word = True
+
+    return count
+
+
+def _count_unicode_split(data):
+    # str.split() with no argument uses the same whitespace table as isspace()
+    return len(_as_text(data).split())
+
+
+def _count_unicode_numpy(data, block=NUMPY_BLOCK):
+    import numpy as np
+
+    buf = np.frombuffer(_as_text(data).encode("utf-32-le"), dtype=np.uint32)
+
+    count = 0
+    prev = False
+
+    for i in range(0, len(buf), block):
+        word = ~np.isin(buf[i : i + block], _SPACE_CODES)
+        count += int(np.count_nonzero(word[1:] & ~word[:-1]))
+        if word[0] and not prev:
+            count += 1
+        prev = bool(word[-1])
+
+    return count
+
+
+_SPACE_CODES = sorted(ord(ch) for ch in UNICODE_SPACES)
+
+ENGINES = {
+    "loop": count_words,
+    "split": _count_split,
+    "numpy": _count_numpy,
+}
+
+UNICODE_ENGINES = {
+    "loop": _count_unicode_loop,
+    "split": _count_unicode_split,
+    "numpy": _count_unicode_numpy,
+}
+
+
+# =========================================streaming / file counting========================================================
+
+def _count_chunk(chunk):
+    # returns (words, starts inside a word, ends inside a word)
+    # works for str and bytes: in UTF-8 the byte 0x20 only ever means " "
+    if isinstance(chunk, memoryview):
+        chunk = chunk.tobytes()
+    space = b" " if _is_bytes(chunk) else " "
+
+    return _count_split(chunk), chunk[:1] != space, chunk[-1:] != space
+
+
+def _merge_parts(parts):
+    # a word cut by a chunk boundary is counted on both sides, so take one back
+    total = 0
+    prev_last = False
+
+    for count, first, last in parts:
+        total += count
+        if prev_last and first:
+            total -= 1
+        prev_last = last
+
+    return total
+
+
+def count_words_stream(chunks):
+    # chunks: any iterable of str or bytes pieces (file reads, socket data, ...)
+    return _merge_parts(_count_chunk(c) for c in chunks if len(c))
+
+
+def _read_chunks(path, start=0, end=None, chunk_size=CHUNK_SIZE):
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = None if end is None else end - start
+
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            data = f.read(size)
+            if not data:
+                break
+            if remaining is not None:
+                remaining -= len(data)
+            yield data
+
+
+def _count_range(args):
+    path, start, end, chunk_size = args
+    parts = [_count_chunk(c) for c in _read_chunks(path, start, end, chunk_size) if c]
+    if not parts:
+        return None
+
+    # first/last flags of the whole range are needed to stitch ranges together
+    return _merge_parts(parts), parts[0][1], parts[-1][2]
+
+
+def count_words_file(path, chunk_size=CHUNK_SIZE, workers=1):
+    size = os.path.getsize(path)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or size <= chunk_size:
+        return count_words_stream(_read_chunks(path, chunk_size=chunk_size))
+
+    # 🔥 split the file into one byte range per worker and stitch the results
+    step = -(-size // workers)
+    ranges = [(path, s, min(s + step, size), chunk_size) for s in range(0, size, step)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = [p for p in pool.map(_count_range, ranges) if p is not None]
+
+    return _merge_parts(parts)
+
+
+# =========================================batch / corpus statistics========================================================
+
+def count_words_batch(sentences, unicode_spaces=False):
+    import numpy as np
+
+    # one big buffer instead of one Python call per sentence; UTF-32 keeps
+    # exactly one array cell per character so the offsets are just len()
+    if not sentences:
+        return np.zeros(0, dtype=np.int64)
+
+    lengths = np.fromiter((len(s) for s in sentences), dtype=np.int64, count=len(sentences))
+    text = " ".join(sentences).encode("utf-32-le")
+    buf = np.frombuffer(text, dtype=np.uint32)
+
+    # the joining " " means every sentence starts fresh, like a separate call
+    word = ~np.isin(buf, _SPACE_CODES) if unicode_spaces else buf != 32
+    first = word.copy()
+    first[1:] &= ~word[:-1]
+    starts = np.concatenate(([0], np.cumsum(first)))  # word starts before each index
+
+    begin = np.concatenate(([0], np.cumsum(lengths[:-1] + 1)))
+    return starts[begin + lengths] - starts[begin]
+
+
+class MisraGries:
+    # bounded-memory heavy hitters: keeps at most 2 * capacity counters and
+    # every reported count is at most total / (capacity + 1) below the truth
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.counters = {}
+
+    def update(self, counts):
+        counters = self.counters
+        for item, n in counts.items():
+            counters[item] = counters.get(item, 0) + n
+
+        if len(counters) > 2 * self.capacity:
+            self._prune()
+
+    def _prune(self):
+        counters = self.counters
+        cut = heapq.nlargest(self.capacity + 1, counters.values())[-1]
+        self.counters = {k: v - cut for k, v in counters.items() if v > cut}
+
+    def top(self, k):
+        if len(self.counters) > self.capacity:
+            self._prune()
+        return heapq.nlargest(k, self.counters.items(), key=lambda kv: kv[1])
+
+
+def corpus_stats(chunks, top_k=10, capacity=10000):
+    # single pass over str/bytes chunks (an open file, _read_chunks(), ...)
+    # words are the space-separated pieces of each line
+    heavy = MisraGries(capacity)
+    words = lines = nbytes = 0
+    pending = []  # pieces of the word that runs into the next chunk
+    open_line = False  # does the data so far end inside a line?
+
+    def add_words(data):
+        nonlocal words
+        tokens = Counter(data.replace(b"\n", b" ").split(b" "))
+        tokens.pop(b"", None)
+        words += sum(tokens.values())
+        heavy.update(tokens)
+
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        if not chunk:
+            continue
+        nbytes += len(chunk)
+        lines += chunk.count(b"\n")
+        open_line = chunk[-1:] != b"\n"
+
+        # everything up to the last space or newline is complete words, so
+        # only the unfinished word is carried over, however long the line;
+        # its pieces are joined once, not re-copied for every chunk
+        cut = max(chunk.rfind(b"\n"), chunk.rfind(b" "))
+        if cut < 0:
+            pending.append(chunk)
+            continue
+        pending.append(chunk[:cut])
+        add_words(b"".join(pending))
+        pending = [chunk[cut + 1 :]]
+
+    if open_line:
+        lines += 1  # last line without a trailing newline
+    add_words(b"".join(pending))
+
+    top = [(w.decode(errors="replace"), n) for w, n in heavy.top(top_k)]
+    return {"words": words, "lines": lines, "bytes": nbytes, "top": top}
+
+
+if __name__ == "__main__":
+    # 🔍 Test cases
+    test_cases = [
+        "hello world",
+        "   hello world",
+        "hello   world",
+        "   hello   world  ",
+        "",
+        "one",
+        "   ",
+        "python is fun",
+        "  multiple   spaces   here "
+    ]
+
+    # Run tests
+    for t in test_cases:
+        print(f"Input: '{t}'")
+        print("Word count:", count_words(t))
+        print("-" * 30)